@@ -5,6 +5,7 @@ Converts a single bounding box to a binary mask.
 Simple 1:1 conversion - for multiple bboxes, use BBoxesToMask.
 """
 
+import inspect
 import torch
 
 
@@ -105,4 +106,7 @@ class BBoxToMask:
                 # Only bbox is white
                 mask[y1:y2, x1:x2] = 1.0
 
-        return (mask,)
\ No newline at end of file
+        return (mask,)
+
+    # Parameter names of bbox_to_mask, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(bbox_to_mask).parameters) - {'self'}
@@ -6,6 +6,19 @@ Generates both box and point queries for SAM3 refinement.
 """
 
 import json
+import math
+
+import numpy as np
+
+
+# TBG query schemas are fixed, so JSON is emitted straight from templates.
+# repr() of a finite float matches json.dumps, so output is identical to
+# dumping dicts; non-finite coordinates go through json.dumps (NaN/Infinity).
+_TBG_BOX_TEMPLATE = '{{"x1": {!r}, "y1": {!r}, "x2": {!r}, "y2": {!r}}}'
+_TBG_POINT_TEMPLATE = '{{"x": {!r}, "y": {!r}}}'
+
+# prompt_type -> (box label, point label) for SAM3 prompts
+_LABELS = {"positive": (True, 1), "negative": (False, 0)}
 
 
 class BBoxToSAM3Query:
@@ -16,9 +29,12 @@ class BBoxToSAM3Query:
     - SAM3 format: Normalized coordinates with label arrays
     - TBG SAM3 Selector format: Absolute coordinates
 
-    BBOX format: [[x, y, width, height]]
+    BBOX format: [[x, y, width, height]] (or several boxes: [[x, y, w, h], ...])
+    All boxes are converted in one vectorized pass. Entries that are not
+    [x, y, w, h] lists are skipped; a non-numeric coordinate makes the whole
+    input invalid.
 
-    SAM3 format outputs:
+    SAM3 format outputs (one entry per box):
     - box_prompt: {"boxes": [[x_norm, y_norm, w_norm, h_norm]], "labels": [True/False]}
     - point_prompt: {"points": [[x_norm, y_norm]], "labels": [1/0]}
 
@@ -27,30 +43,42 @@ class BBoxToSAM3Query:
     - point_query_tbg: [{"x": float, "y": float}]
     """
 
+    # Built once - ComfyUI only reads the INPUT_TYPES schema
+    _INPUT_TYPES = {
+        "required": {
+            "bbox": ("BBOX", {}),
+        },
+        "optional": {
+            "width": ("INT", {"default": 0, "min": 0, "max": 10000}),
+            "height": ("INT", {"default": 0, "min": 0, "max": 10000}),
+            "prompt_type": (["positive", "negative"], {"default": "positive"}),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {
-                "bbox": ("BBOX", {}),
-            },
-            "optional": {
-                "width": ("INT", {"default": 0, "min": 0, "max": 10000}),
-                "height": ("INT", {"default": 0, "min": 0, "max": 10000}),
-                "prompt_type": (["positive", "negative"], {"default": "positive"}),
-            },
-        }
+        return cls._INPUT_TYPES
+
+    # Shared TBG output for empty/invalid input (strings are immutable)
+    _EMPTY_JSON = "[]"
 
     RETURN_TYPES = ("SAM3_BOXES_PROMPT", "SAM3_POINTS_PROMPT", "STRING", "STRING")
     RETURN_NAMES = ("box_sam3", "point_sam3", "box_tbg_sam3", "point_tbg_sam3")
     FUNCTION = "bbox_to_sam3_query"
     CATEGORY = "JK-TextTools/bbox"
 
+    @staticmethod
+    def _empty_prompts():
+        """Empty SAM3 prompts. Built per call - the dicts go to other nodes,
+        which may modify them."""
+        return ({"boxes": [], "labels": []}, {"points": [], "labels": []})
+
     def bbox_to_sam3_query(self, bbox, width=0, height=0, prompt_type="positive"):
         """
         Convert BBOX to SAM3 query formats.
 
         Args:
-            bbox: [[x, y, w, h]] format (XYWH)
+            bbox: [[x, y, w, h], ...] format (XYWH)
             width: Image width (required for SAM3 normalized coordinates)
             height: Image height (required for SAM3 normalized coordinates)
             prompt_type: "positive" or "negative" (for SAM3 labels)
@@ -66,84 +94,114 @@ class BBoxToSAM3Query:
         if isinstance(prompt_type, list):
             prompt_type = prompt_type[0]
 
-        # Validate and unwrap bbox
-        if not isinstance(bbox, list) or len(bbox) == 0:
-            # Empty bbox - return empty queries
-            empty_box_prompt = {"boxes": [], "labels": []}
-            empty_point_prompt = {"points": [], "labels": []}
-            return (empty_box_prompt, empty_point_prompt, "[]", "[]")
+        box_prompt, point_prompt, xyxy_rows, center_rows = self._compute(bbox, width, height, prompt_type)
+
+        if not xyxy_rows:
+            # Empty/invalid bbox - return empty queries
+            return (box_prompt, point_prompt, self._EMPTY_JSON, self._EMPTY_JSON)
 
-        # Handle both [[x,y,w,h]] and [x,y,w,h] formats
-        if isinstance(bbox[0], list):
-            box = bbox[0]
+        # === TBG SAM3 Selector Format Outputs (absolute coordinates) ===
+        # A finite sum means every coordinate is finite (repr() would give
+        # nan/inf, which is not JSON)
+        if math.isfinite(sum(map(sum, xyxy_rows)) + sum(map(sum, center_rows))):
+            # Create TBG box query (XYXY format) as a JSON string
+            box_query_tbg_str = "[" + ", ".join(
+                _TBG_BOX_TEMPLATE.format(*row) for row in xyxy_rows
+            ) + "]"
+
+            # Create TBG point query (center points) as a JSON string
+            point_query_tbg_str = "[" + ", ".join(
+                _TBG_POINT_TEMPLATE.format(*row) for row in center_rows
+            ) + "]"
         else:
-            box = bbox
+            box_query_tbg_str = json.dumps(
+                [{"x1": x1, "y1": y1, "x2": x2, "y2": y2} for x1, y1, x2, y2 in xyxy_rows]
+            )
+            point_query_tbg_str = json.dumps([{"x": x, "y": y} for x, y in center_rows])
 
-        if len(box) != 4:
-            # Invalid bbox - return empty queries
-            empty_box_prompt = {"boxes": [], "labels": []}
-            empty_point_prompt = {"points": [], "labels": []}
-            return (empty_box_prompt, empty_point_prompt, "[]", "[]")
+        return (box_prompt, point_prompt, box_query_tbg_str, point_query_tbg_str)
 
-        # Extract coordinates (XYWH format)
-        x, y, w, h = box
-        x, y, w, h = float(x), float(y), float(w), float(h)
+    def _compute(self, bbox, width, height, prompt_type):
+        """
+        Compute SAM3 prompts and TBG coordinates without JSON serialization.
+
+        Returns:
+            tuple: (box_prompt_dict, point_prompt_dict, xyxy_rows, center_rows)
+                where the rows are lists of [x1, y1, x2, y2] and [x, y] floats
+        """
+        # Validate and unwrap bbox
+        if not isinstance(bbox, list) or len(bbox) == 0:
+            # Empty bbox - return empty queries
+            return (*self._empty_prompts(), [], [])
+
+        # Stack all boxes into one (N, 4) XYWH array. Well-formed input
+        # converts directly; ragged input falls back to keeping only the
+        # [x, y, w, h] boxes, like JSONToBBox.
+        try:
+            arr = np.asarray(bbox, dtype=np.float64)
+        except (TypeError, ValueError):
+            arr = None
+        else:
+            # Handle both [[x,y,w,h], ...] and [x,y,w,h] formats
+            if arr.ndim == 1:
+                arr = arr[np.newaxis]
+
+        if arr is None or arr.ndim != 2 or arr.shape[1] != 4:
+            rows = [box for box in bbox if isinstance(box, list) and len(box) == 4]
+            try:
+                arr = np.asarray(rows, dtype=np.float64)
+            except (TypeError, ValueError):
+                # Non-numeric coordinates - the whole input is invalid
+                arr = None
+
+            if arr is None or arr.ndim != 2:
+                # No valid bbox - return empty queries
+                return (*self._empty_prompts(), [], [])
+
+        # SAM3 outputs need image dims for normalization; TBG outputs do not
+        need_sam3 = width > 0 and height > 0
+
+        n = len(arr)
+        xy = arr[:, :2]
+        wh = arr[:, 2:]
+
+        # Write XYXY corners and centers into one preallocated (N, 6) buffer
+        # in a single pass, without intermediate temporaries
+        out = np.empty((n, 6), dtype=np.float64)
+        xyxy = out[:, :4]
+        centers = out[:, 4:]
 
         # Convert XYWH to XYXY for TBG box query
-        x1 = x
-        y1 = y
-        x2 = x + w
-        y2 = y + h
+        xyxy[:, :2] = xy
+        np.add(xy, wh, out=xyxy[:, 2:])
 
-        # Calculate center point for point query
-        center_x = x + (w / 2.0)
-        center_y = y + (h / 2.0)
+        # Calculate center points for point query
+        np.multiply(wh, 0.5, out=centers)
+        centers += xy
 
         # === SAM3 Format Outputs (normalized coordinates) ===
-        # Check if width/height are provided for normalization
-        if width > 0 and height > 0:
-            # Normalize coordinates to 0-1 range
-            x_norm = x / width
-            y_norm = y / height
-            w_norm = w / width
-            h_norm = h / height
-
-            # Normalize center point
-            center_x_norm = center_x / width
-            center_y_norm = center_y / height
-
-            # Determine labels based on prompt type
-            if prompt_type == "positive":
-                box_label = True
-                point_label = 1
-            else:  # negative
-                box_label = False
-                point_label = 0
+        if need_sam3:
+            # Normalize coordinates to 0-1 range (multiply by reciprocals)
+            inv_w = 1.0 / width
+            inv_h = 1.0 / height
+            boxes_norm = arr * np.array([inv_w, inv_h, inv_w, inv_h])
+            centers_norm = centers * np.array([inv_w, inv_h])
+
+            # Determine labels based on prompt type (anything else is negative)
+            box_label, point_label = _LABELS.get(prompt_type, _LABELS["negative"])
 
             # Create SAM3 format prompts (XYWH normalized)
             box_prompt = {
-                "boxes": [[x_norm, y_norm, w_norm, h_norm]],
-                "labels": [box_label]
+                "boxes": boxes_norm.tolist(),
+                "labels": [box_label] * n
             }
 
             point_prompt = {
-                "points": [[center_x_norm, center_y_norm]],
-                "labels": [point_label]
+                "points": centers_norm.tolist(),
+                "labels": [point_label] * n
             }
         else:
             # Width/height not provided - return empty SAM3 outputs
-            box_prompt = {"boxes": [], "labels": []}
-            point_prompt = {"points": [], "labels": []}
-
-        # === TBG SAM3 Selector Format Outputs (absolute coordinates) ===
-        # Create TBG box query (XYXY format)
-        box_query_tbg = [{"x1": x1, "y1": y1, "x2": x2, "y2": y2}]
+            box_prompt, point_prompt = self._empty_prompts()
 
-        # Create TBG point query (center point)
-        point_query_tbg = [{"x": center_x, "y": center_y}]
-
-        # Convert TBG outputs to JSON strings
-        box_query_tbg_str = json.dumps(box_query_tbg)
-        point_query_tbg_str = json.dumps(point_query_tbg)
-
-        return (box_prompt, point_prompt, box_query_tbg_str, point_query_tbg_str)
+        return (box_prompt, point_prompt, xyxy.tolist(), centers.tolist())
@@ -5,6 +5,7 @@ Converts a list of bounding boxes to masks.
 Takes the full bbox list (not OUTPUT_IS_LIST) and creates combined mask.
 """
 
+import inspect
 import torch
 
 
@@ -132,3 +133,6 @@ class BBoxesToMask:
         count = len(individual_masks)
         
         return (combined_mask, individual_masks, count)
+
+    # Parameter names of bboxes_to_mask, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(bboxes_to_mask).parameters) - {'self'}
@@ -7,6 +7,18 @@ Designed for object detection/classification workflow outputs.
 
 import json
 import fnmatch
+import functools
+import inspect
+import operator
+import re
+
+import numpy as np
+
+try:
+    from .json_utils import loads as _loads
+except ImportError:
+    # Imported as a top-level module (tests), not as part of the package
+    from json_utils import loads as _loads
 
 
 # Wildcard trick from ImpactPack/pythongossss
@@ -17,6 +29,66 @@ class AnyType(str):
 any_typ = AnyType("*")
 
 
+_WILDCARD_CHARS = re.compile(r"[*?\[]")
+
+
+# Detection count from which score thresholds are applied with NumPy first
+_VECTORIZE_MIN_DETECTIONS = 64
+
+# Score types the vectorized prefilter accepts (exact types - bool is excluded)
+_NUMERIC_SCORE_TYPES = (int, float)
+
+
+def _match_segments(class_name, head, middle, tail):
+    """Match a "*"-only glob split into its literal head, middle and tail segments."""
+    end = len(class_name) - len(tail)
+    if end < len(head) or not class_name.startswith(head) or not class_name.endswith(tail):
+        return False
+
+    # Leftmost match of each middle segment leaves the most room for the rest
+    pos = len(head)
+    for segment in middle:
+        pos = class_name.find(segment, pos, end)
+        if pos < 0:
+            return False
+        pos += len(segment)
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_class_filter(class_filter):
+    """
+    Compile a wildcard class filter once and return its match function.
+
+    Exact, prefix ("CLASS1_*"), suffix ("*_LABEL") and contains ("*SUB*")
+    filters use plain string comparisons, other "*"-only filters use
+    str.find per segment, and "?" or "[...]" filters fall back to a
+    compiled regex.
+    """
+    if not _WILDCARD_CHARS.search(class_filter):
+        return lambda class_name: class_name == class_filter
+
+    literal = class_filter.strip("*")
+    if not _WILDCARD_CHARS.search(literal):
+        if class_filter == literal + "*":
+            return lambda class_name: class_name.startswith(literal)
+        if class_filter == "*" + literal:
+            return lambda class_name: class_name.endswith(literal)
+        if class_filter == "*" + literal + "*":
+            return lambda class_name: literal in class_name
+
+    if "?" not in class_filter and "[" not in class_filter:
+        segments = class_filter.split("*")
+        return functools.partial(
+            _match_segments,
+            head=segments[0],
+            middle=tuple(segments[1:-1]),
+            tail=segments[-1]
+        )
+
+    return re.compile(fnmatch.translate(class_filter)).match
+
+
 class DetectionQuery:
     """
     Query detection results with filtering and wildcards.
@@ -25,38 +97,41 @@ class DetectionQuery:
     Returns filtered results as JSON, list, and bbox list for visualization.
     """
     
+    # Built once - ComfyUI only reads the INPUT_TYPES schema
+    _INPUT_TYPES = {
+        "required": {
+            "json_string": ("STRING", {
+                "default": "[]",
+                "multiline": True
+            }),
+            "class_filter": ("STRING", {
+                "default": "*",
+                "multiline": False
+            }),
+        },
+        "optional": {
+            "min_score": ("FLOAT", {
+                "default": 0.0,
+                "min": 0.0,
+                "max": 1.0,
+                "step": 0.01
+            }),
+            "max_results": ("INT", {
+                "default": 0,  # 0 = unlimited
+                "min": 0,
+                "max": 1000,
+                "step": 1
+            }),
+            "categorization_field": ("STRING", {
+                "default": "",
+                "multiline": False
+            }),
+        }
+    }
+    
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {
-                "json_string": ("STRING", {
-                    "default": "[]",
-                    "multiline": True
-                }),
-                "class_filter": ("STRING", {
-                    "default": "*",
-                    "multiline": False
-                }),
-            },
-            "optional": {
-                "min_score": ("FLOAT", {
-                    "default": 0.0,
-                    "min": 0.0,
-                    "max": 1.0,
-                    "step": 0.01
-                }),
-                "max_results": ("INT", {
-                    "default": 0,  # 0 = unlimited
-                    "min": 0,
-                    "max": 1000,
-                    "step": 1
-                }),
-                "categorization_field": ("STRING", {
-                    "default": "",
-                    "multiline": False
-                }),
-            }
-        }
+        return cls._INPUT_TYPES
     
     RETURN_TYPES = ("STRING", "INT", any_typ, "BBOX", any_typ, "BOOLEAN", "STRING")
     RETURN_NAMES = ("filtered_json", "match_count", "detection_list", "bbox_list", "categorization_value", "is_valid", "error_message")
@@ -69,8 +144,8 @@ class DetectionQuery:
         Query detection results with filtering.
         
         Args:
-            json_string: JSON string containing detection results
-            class_filter: Class name with wildcards (* and ?)
+            json_string: JSON string containing detection results (or the parsed list/dict)
+            class_filter: Class name with wildcards (* and ?); empty matches all
             min_score: Minimum confidence score (0.0-1.0)
             max_results: Maximum results to return (0 = unlimited)
             categorization_field: Optional field name to extract
@@ -79,8 +154,11 @@ class DetectionQuery:
             tuple: (filtered_json, match_count, detection_list, bbox_list, categorization_value, is_valid, error_message)
         """
         try:
-            # Parse JSON
-            data = json.loads(json_string)
+            # Parse JSON (already-parsed data from another node skips the round-trip)
+            if isinstance(json_string, (list, dict)):
+                data = json_string
+            else:
+                data = _loads(json_string)
             
             # Handle common detection formats
             detections = []
@@ -103,64 +181,84 @@ class DetectionQuery:
             if categorization_field and root_object:
                 categorization_value = root_object.get(categorization_field, None)
             
+            # Pre-filter large detection lists by score in one vectorized pass.
+            # Only plain int/float scores are vectorized - malformed entries and
+            # other score types fall back to the per-detection checks below,
+            # so the result does not depend on the list length.
+            if len(detections) >= _VECTORIZE_MIN_DETECTIONS:
+                try:
+                    scores = [detection["score"] for detection in detections]
+                    if not all(type(score) in _NUMERIC_SCORE_TYPES for score in scores):
+                        raise TypeError("non-numeric score")
+                    scores = np.array(scores, dtype=np.float64)
+                except (KeyError, TypeError, ValueError, OverflowError):
+                    pass
+                else:
+                    # "not below" rather than ">=" so NaN scores are kept, as in the loop
+                    keep = np.flatnonzero(~(scores < min_score))
+                    detections = [detections[i] for i in keep.tolist()]
+            
+            # Compile class filter once (with wildcards) - an empty or "*"
+            # filter matches everything, so class matching is skipped entirely
+            if class_filter in (None, "", "*"):
+                class_matches = None
+            else:
+                class_matches = _compile_class_filter(class_filter)
+
             # Filter detections
             filtered = []
             bbox_list = []  # Collect bboxes as we filter
             
+            # Bind per-detection lookups once, outside the loop
+            get_class_and_score = operator.itemgetter("class", "score")
+            append_detection = filtered.append
+            append_bbox = bbox_list.append
+            
             for detection in detections:
                 # Check if detection has required fields
                 if not isinstance(detection, dict):
                     continue
-                if "class" not in detection or "score" not in detection:
+                try:
+                    class_name, score = get_class_and_score(detection)
+                except KeyError:
                     continue
                 
-                class_name = detection["class"]
-                score = detection["score"]
-                
-                # Apply class filter (with wildcards)
-                if not fnmatch.fnmatch(class_name, class_filter):
+                # Apply class filter (with wildcards) - first, so detections of
+                # other classes are skipped before their score is compared
+                if class_matches is not None and not class_matches(class_name):
                     continue
                 
                 # Apply score filter
                 if score < min_score:
                     continue
                 
-                filtered.append(detection)
+                append_detection(detection)
                 
-                # Extract bbox if present
-                bbox = None
-                if "box" in detection:
-                    bbox = detection["box"]
-                elif "bbox" in detection:
-                    bbox = detection["bbox"]
+                # Extract bbox if present ("box" is the common key, so one lookup)
+                bbox = detection.get("box")
+                if bbox is None:
+                    bbox = detection.get("bbox")
                 
                 # Add to bbox_list in proper format
                 # For OUTPUT_IS_LIST, each bbox needs to be wrapped: [[x,y,w,h]]
                 if bbox and len(bbox) == 4:
                     # Wrap each bbox in a list for BBOX format
-                    bbox_list.append([[int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3])]])
+                    append_bbox([[int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3])]])
                 else:
                     # No valid bbox - add zeros (wrapped)
-                    bbox_list.append([[0, 0, 0, 0]])
-            
-            # Apply max_results limit
-            if max_results > 0:
-                filtered = filtered[:max_results]
-                bbox_list = bbox_list[:max_results]
+                    append_bbox([[0, 0, 0, 0]])
+                
+                # Apply max_results limit - stop as soon as it is reached
+                if len(filtered) == max_results:
+                    break
             
             # Prepare outputs
             count = len(filtered)
             
             # JSON output (wrapped in same format as input)
-            if isinstance(data, list) and len(data) > 0 and "detect_result" in data[0]:
-                output_obj = {
-                    "detect_result": filtered
-                }
-                # Preserve other fields from root object
-                if root_object:
-                    for key, value in root_object.items():
-                        if key != "detect_result":
-                            output_obj[key] = value
+            if isinstance(data, list) and root_object is not None:
+                # Preserve other fields from root object, replacing only the results
+                output_obj = {**root_object, "detect_result": filtered}
                 filtered_json = json.dumps([output_obj], indent=2)
             else:
                 filtered_json = json.dumps(filtered, indent=2)
@@ -176,4 +274,7 @@ class DetectionQuery:
             
         except Exception as e:
             error_msg = f"Error: {str(e)}"
-            return ("[]", 0, [], [], None, False, error_msg)
\ No newline at end of file
+            return ("[]", 0, [], [], None, False, error_msg)
+
+    # Parameter names of query_detections, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(query_detections).parameters) - {'self'}
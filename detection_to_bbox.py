@@ -5,7 +5,16 @@ Extracts bounding box from detection JSON and converts to BBOX format.
 Compatible with KJNodes BBox visualizer and other bbox-aware nodes.
 """
 
-import json
+import inspect
+
+try:
+    from .json_utils import loads as _loads
+except ImportError:
+    # Imported as a top-level module (tests), not as part of the package
+    from json_utils import loads as _loads
+
+# Keys checked for a bbox when the selected bbox_key is missing
+_BBOX_KEYS = ("box", "bbox")
 
 
 class DetectionToBBox:
@@ -25,19 +34,22 @@ class DetectionToBBox:
     Output: [x, y, width, height] as separate values or list
     """
     
+    # Built once - ComfyUI only reads the INPUT_TYPES schema
+    _INPUT_TYPES = {
+        "required": {
+            "detection": ("STRING", {
+                "default": "{}",
+                "multiline": True
+            }),
+        },
+        "optional": {
+            "bbox_key": (["box", "bbox"],),  # Which key to look for
+        }
+    }
+    
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {
-                "detection": ("STRING", {
-                    "default": "{}",
-                    "multiline": True
-                }),
-            },
-            "optional": {
-                "bbox_key": (["box", "bbox"],),  # Which key to look for
-            }
-        }
+        return cls._INPUT_TYPES
     
     RETURN_TYPES = ("BBOX", "INT", "INT", "INT", "INT", "STRING", "FLOAT")
     RETURN_NAMES = ("bbox", "x", "y", "width", "height", "class_name", "score")
@@ -58,43 +70,40 @@ class DetectionToBBox:
         try:
             # Parse detection if it's a string
             if isinstance(detection, str):
-                det = json.loads(detection)
+                det = _loads(detection)
             else:
                 det = detection
             
-            # Extract bbox
-            if bbox_key in det:
-                bbox = det[bbox_key]
-            elif "box" in det:
-                bbox = det["box"]
-            elif "bbox" in det:
-                bbox = det["bbox"]
-            else:
-                # No bbox found - return zeros but still extract class/score
-                class_name = det.get("class", "")
-                score = det.get("score", 0.0)
-                return ([[0, 0, 0, 0]], 0, 0, 0, 0, class_name, float(score))
-            
-            # Ensure bbox has 4 values
-            if len(bbox) != 4:
-                # Invalid bbox - return zeros but still extract class/score
-                class_name = det.get("class", "")
-                score = det.get("score", 0.0)
-                return ([[0, 0, 0, 0]], 0, 0, 0, 0, class_name, float(score))
-            
-            x, y, w, h = bbox
-            
             # Extract class and score if available
             class_name = det.get("class", "")
-            score = det.get("score", 0.0)
+            score = float(det.get("score", 0.0))
+            
+            # Extract bbox - the selected key first, then any known key
+            bbox = det.get(bbox_key)
+            if bbox is None:
+                for key in _BBOX_KEYS:
+                    bbox = det.get(key)
+                    if bbox is not None:
+                        break
+            
+            # Unpack and truncate in one step - a missing bbox, wrong number of
+            # values or non-numeric values return zeros but keep class/score
+            try:
+                x, y, w, h = bbox
+                x, y, w, h = int(x), int(y), int(w), int(h)
+            except (TypeError, ValueError):
+                return ([[0, 0, 0, 0]], 0, 0, 0, 0, class_name, score)
             
             # BBOX format for KJNodes: list of lists [[x, y, w, h]]
-            bbox_list = [[int(x), int(y), int(w), int(h)]]
+            bbox_list = [[x, y, w, h]]
             
             # Return bbox as nested list, plus individual values
-            return (bbox_list, int(x), int(y), int(w), int(h), class_name, float(score))
+            return (bbox_list, x, y, w, h, class_name, score)
             
         except Exception as e:
             # Return zeros on error
             print(f"Error extracting bbox: {e}")
-            return ([[0, 0, 0, 0]], 0, 0, 0, 0, "", 0.0)
\ No newline at end of file
+            return ([[0, 0, 0, 0]], 0, 0, 0, 0, "", 0.0)
+
+    # Parameter names of extract_bbox, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(extract_bbox).parameters) - {'self'}
@@ -5,6 +5,7 @@ Formats JSON strings with proper indentation for readability.
 Validates JSON and provides error messages for invalid input.
 """
 
+import inspect
 import json
 
 
@@ -98,4 +99,7 @@ class JSONPrettyPrinter:
         except Exception as e:
             # Catch any other errors
             error_msg = f"Error processing JSON: {str(e)}"
-            return (json_string, False, error_msg)
\ No newline at end of file
+            return (json_string, False, error_msg)
+
+    # Parameter names of format_json, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(format_json).parameters) - {'self'}
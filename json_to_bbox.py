@@ -5,8 +5,17 @@ Converts JSON string representation of bboxes to proper BBOX format.
 Designed for nodes that output bboxes as JSON strings (like SAM3).
 """
 
+import inspect
 import json
 
+import numpy as np
+
+try:
+    from .json_utils import loads as _loads
+except ImportError:
+    # Imported as a top-level module (tests), not as part of the package
+    from json_utils import loads as _loads
+
 
 class JSONToBBox:
     """
@@ -15,23 +24,29 @@ class JSONToBBox:
     Handles JSON arrays like:
     [[x1,y1,x2,y2], [x1,y1,x2,y2], ...]
     
+    Entries that are not [a, b, c, d] lists are skipped; a null or
+    non-numeric coordinate makes the whole input invalid.
+    
     Can convert between coordinate formats:
     - XYXY (x1, y1, x2, y2) - two corners
     - XYWH (x, y, width, height) - corner + dimensions
     """
     
+    # Built once - ComfyUI only reads the INPUT_TYPES schema
+    _INPUT_TYPES = {
+        "required": {
+            "json_string": ("STRING", {
+                "default": "[]",
+                "multiline": True
+            }),
+            "input_format": (["XYXY", "XYWH"],),  # Format in the JSON
+            "output_format": (["XYXY", "XYWH"],),  # Format to output
+        },
+    }
+    
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {
-                "json_string": ("STRING", {
-                    "default": "[]",
-                    "multiline": True
-                }),
-                "input_format": (["XYXY", "XYWH"],),  # Format in the JSON
-                "output_format": (["XYXY", "XYWH"],),  # Format to output
-            },
-        }
+        return cls._INPUT_TYPES
     
     RETURN_TYPES = ("*", "INT")
     RETURN_NAMES = ("bboxes", "bbox_count")
@@ -44,7 +59,8 @@ class JSONToBBox:
         Convert JSON string to bbox list.
         
         Args:
-            json_string: JSON array of bboxes
+            json_string: JSON array of bboxes (str, or bytes as read from a
+                file/HTTP response - parsed as-is without decoding first)
             input_format: Format in JSON ("XYXY" or "XYWH")
             output_format: Format to output ("XYXY" or "XYWH")
             
@@ -52,43 +68,52 @@ class JSONToBBox:
             tuple: (bbox_list, count)
         """
         try:
+            # Only a JSON array can hold bboxes - reject anything else from its
+            # first character without running the parser (str or bytes input)
+            head = json_string.lstrip()[:1]
+            if head != "[" and head != b"[":
+                return ([], 0)
+            
             # Parse JSON
-            data = json.loads(json_string)
+            data = _loads(json_string)
             
             if not isinstance(data, list):
                 # Not a list - return empty
                 return ([], 0)
             
-            bboxes = []
+            # Convert all bboxes to floats at once. Well-formed input converts
+            # directly; ragged input falls back to keeping only [a, b, c, d] rows.
+            rows = data
+            try:
+                arr = np.array(rows, dtype=np.float64)
+            except (TypeError, ValueError):
+                arr = None
             
-            for bbox in data:
-                if not isinstance(bbox, list) or len(bbox) != 4:
-                    continue
-                
-                # Convert to floats/ints
-                bbox = [float(x) for x in bbox]
-                
-                # Convert format if needed
-                if input_format == "XYXY" and output_format == "XYWH":
-                    # Convert (x1, y1, x2, y2) to (x, y, w, h)
-                    x1, y1, x2, y2 = bbox
-                    x = x1
-                    y = y1
-                    w = x2 - x1
-                    h = y2 - y1
-                    bbox = [x, y, w, h]
-                    
-                elif input_format == "XYWH" and output_format == "XYXY":
-                    # Convert (x, y, w, h) to (x1, y1, x2, y2)
-                    x, y, w, h = bbox
-                    x1 = x
-                    y1 = y
-                    x2 = x + w
-                    y2 = y + h
-                    bbox = [x1, y1, x2, y2]
+            if arr is None or arr.ndim != 2 or arr.shape[1] != 4:
+                rows = [bbox for bbox in data if isinstance(bbox, list) and len(bbox) == 4]
+                if not rows:
+                    return ([], 0)
+                arr = np.array(rows, dtype=np.float64)
+                if arr.ndim != 2:
+                    # Nested coordinates - not a bbox list
+                    return ([], 0)
+            
+            # NumPy turns null into NaN where float() raises, so a null
+            # coordinate still fails the whole input (NaN values are kept)
+            if np.isnan(arr).any() and any(value is None for bbox in rows for value in bbox):
+                raise TypeError("bbox coordinates must be numbers, not null")
+            
+            # Convert format if needed (in place, all bboxes in one operation)
+            if input_format == "XYXY" and output_format == "XYWH":
+                # Convert (x1, y1, x2, y2) to (x, y, w, h)
+                arr[:, 2:] -= arr[:, :2]
                 
-                # Wrap in list for BBOX format: [[x,y,w,h]]
-                bboxes.append([bbox])
+            elif input_format == "XYWH" and output_format == "XYXY":
+                # Convert (x, y, w, h) to (x1, y1, x2, y2)
+                arr[:, 2:] += arr[:, :2]
+            
+            # Wrap in list for BBOX format: [[x,y,w,h]]
+            bboxes = [[bbox] for bbox in arr.tolist()]
             
             return (bboxes, len(bboxes))
             
@@ -98,3 +123,6 @@ class JSONToBBox:
         except Exception as e:
             print(f"Error converting JSON to bbox: {e}")
             return ([], 0)
+
+    # Parameter names of json_to_bbox, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(json_to_bbox).parameters) - {'self'}
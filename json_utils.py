@@ -0,0 +1,21 @@
+"""
+Shared JSON helpers for the JK-TextTools nodes
+
+Not a node - the detection and bbox nodes import their JSON parser from here.
+"""
+
+import json
+
+# orjson is optional - it parses detection/bbox JSON several times faster
+try:
+    import orjson
+
+    def loads(json_string):
+        """Parse JSON like json.loads, using orjson when it accepts the input."""
+        try:
+            return orjson.loads(json_string)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json.loads accepts
+            return json.loads(json_string)
+except ImportError:
+    loads = json.loads
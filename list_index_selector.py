@@ -5,6 +5,8 @@ Extracts an item from a list by index.
 Companion to String Splitter for list-based workflows.
 """
 
+import inspect
+
 # wildcard trick is taken from pythongossss's & ImpactPack
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
@@ -77,4 +79,7 @@ class ListIndexSelector:
         selected = list_input[actual_index]
         length = len(list_input)
         
-        return (selected, length)
\ No newline at end of file
+        return (selected, length)
+
+    # Parameter names of select_from_list, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(select_from_list).parameters) - {'self'}
@@ -5,6 +5,8 @@ Converts binary masks to bounding boxes in XYWH format.
 Useful for nodes that output rectangular masks instead of proper BBOX type.
 """
 
+import inspect
+
 import torch
 
 
@@ -19,19 +21,28 @@ class MaskToBBox:
     Mask threshold: Pixels > 0.5 are considered part of the mask.
     """
 
+    # Built once - ComfyUI only reads the INPUT_TYPES schema
+    _INPUT_TYPES = {
+        "required": {
+            "mask": ("MASK", {}),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {
-                "mask": ("MASK", {}),
-            },
-        }
+        return cls._INPUT_TYPES
 
     RETURN_TYPES = ("BBOX", "INT", "INT", "INT", "INT")
     RETURN_NAMES = ("bbox", "x", "y", "w", "h")
     FUNCTION = "mask_to_bbox"
     CATEGORY = "JK-TextTools/mask"
 
+    @staticmethod
+    def _empty_result():
+        """Zero bbox for empty/invalid masks. Built per call - the bbox list
+        goes to other nodes, which may modify it."""
+        return ([[0, 0, 0, 0]], 0, 0, 0, 0)
+
     def mask_to_bbox(self, mask):
         """
         Convert mask to bounding box.
@@ -42,36 +53,42 @@ class MaskToBBox:
         Returns:
             tuple: (bbox, x, y, w, h)
         """
-        # Validate mask
-        if not isinstance(mask, torch.Tensor):
-            # Invalid mask - return empty bbox
-            return ([[0, 0, 0, 0]], 0, 0, 0, 0)
+        # Validate mask (a single mask or a batch)
+        if not isinstance(mask, torch.Tensor) or mask.ndim not in (2, 3):
+            # Invalid mask or dimensions - return empty bbox
+            return self._empty_result()
 
         # Handle batch dimension if present
         if mask.ndim == 3:
             # Take first mask if batched
             mask = mask[0]
 
-        if mask.ndim != 2:
-            # Invalid dimensions - return empty bbox
-            return ([[0, 0, 0, 0]], 0, 0, 0, 0)
+        # Find all non-zero pixels (threshold at 0.5 for float masks). Bool
+        # masks are already thresholded, so they are used without a compare.
+        if mask.dtype == torch.bool:
+            mask_pixels = mask
+        else:
+            mask_pixels = mask > 0.5
 
-        # Find all non-zero pixels (threshold at 0.5 for float masks)
-        mask_pixels = mask > 0.5
+        # Project onto each axis - the bbox only needs the first and last
+        # occupied row and column, not the coordinates of every pixel
+        rows = torch.nonzero(mask_pixels.any(dim=1)).flatten()
 
         # Check if mask is empty
-        if not mask_pixels.any():
+        if rows.numel() == 0:
             # Empty mask - return zero bbox
-            return ([[0, 0, 0, 0]], 0, 0, 0, 0)
+            return self._empty_result()
 
-        # Get coordinates of all mask pixels
-        y_coords, x_coords = torch.where(mask_pixels)
+        # Calculate bounding box (min/max coordinates). Each axis reads its
+        # first and last index back in one tolist(), so the bounds are host
+        # ints - slicing with them does not sync once per bound.
+        y_min, y_max = rows[[0, -1]].tolist()
 
-        # Calculate bounding box (min/max coordinates)
-        x_min = int(x_coords.min().item())
-        y_min = int(y_coords.min().item())
-        x_max = int(x_coords.max().item())
-        y_max = int(y_coords.max().item())
+        # Rows outside [first, last] are empty, so the column projection only
+        # has to scan the occupied row band rather than the whole mask again
+        row_band = mask_pixels[y_min:y_max + 1]
+        cols = torch.nonzero(row_band.any(dim=0)).flatten()
+        x_min, x_max = cols[[0, -1]].tolist()
 
         # Calculate width and height (inclusive of max pixel)
         width = x_max - x_min + 1
@@ -81,3 +98,6 @@ class MaskToBBox:
         bbox = [[x_min, y_min, width, height]]
 
         return (bbox, x_min, y_min, width, height)
+
+    # Parameter names of mask_to_bbox, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(mask_to_bbox).parameters) - {'self'}
@@ -45,6 +45,12 @@ class SEGsToSAM3Query:
     FUNCTION = "segs_to_sam3_query"
     CATEGORY = "JK-TextTools/segs"
 
+    @staticmethod
+    def _empty_result():
+        """Empty queries for empty/invalid input. Built per call - the prompt
+        dicts go to other nodes, which may modify them."""
+        return ({"boxes": [], "labels": []}, {"points": [], "labels": []}, "[]", "[]")
+
     def segs_to_sam3_query(self, segs, prompt_type="positive"):
         """
         Convert SEGS to SAM3 query formats.
@@ -63,9 +69,7 @@ class SEGsToSAM3Query:
         # Validate SEGS format
         if not isinstance(segs, tuple) or len(segs) != 2:
             # Invalid SEGS format - return empty queries
-            empty_box_prompt = {"boxes": [], "labels": []}
-            empty_point_prompt = {"points": [], "labels": []}
-            return (empty_box_prompt, empty_point_prompt, "[]", "[]")
+            return self._empty_result()
 
         dims, seg_list = segs
 
@@ -74,16 +78,12 @@ class SEGsToSAM3Query:
             height, width = dims
         else:
             # Invalid dimensions - return empty
-            empty_box_prompt = {"boxes": [], "labels": []}
-            empty_point_prompt = {"points": [], "labels": []}
-            return (empty_box_prompt, empty_point_prompt, "[]", "[]")
+            return self._empty_result()
 
         # Validate seg_list
         if not isinstance(seg_list, list) or len(seg_list) == 0:
             # Empty seg list - return empty queries
-            empty_box_prompt = {"boxes": [], "labels": []}
-            empty_point_prompt = {"points": [], "labels": []}
-            return (empty_box_prompt, empty_point_prompt, "[]", "[]")
+            return self._empty_result()
 
         # Reconstruct full mask by unioning all segments
         full_mask = torch.zeros((height, width), dtype=torch.float32)
@@ -154,18 +154,14 @@ class SEGsToSAM3Query:
 
         # If no valid masks found, return empty queries
         if not has_valid_mask:
-            empty_box_prompt = {"boxes": [], "labels": []}
-            empty_point_prompt = {"points": [], "labels": []}
-            return (empty_box_prompt, empty_point_prompt, "[]", "[]")
+            return self._empty_result()
 
         # Find all non-zero pixels (use threshold for floating point masks)
         mask_pixels = full_mask > 0.5
 
         # Check if mask is empty
         if not mask_pixels.any():
-            empty_box_prompt = {"boxes": [], "labels": []}
-            empty_point_prompt = {"points": [], "labels": []}
-            return (empty_box_prompt, empty_point_prompt, "[]", "[]")
+            return self._empty_result()
 
         # Get coordinates of all mask pixels
         y_coords, x_coords = torch.where(mask_pixels)
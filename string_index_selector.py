@@ -5,6 +5,8 @@ Extract a single element from a delimited string by index.
 Perfect for loop iterations where you need the Nth item.
 """
 
+import inspect
+
 # wildcard trick is taken from pythongossss's & ImpactPack
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
@@ -121,3 +123,6 @@ class StringIndexSelector:
         count = len(items)
         
         return (selected, count)
+
+    # Parameter names of select_by_index, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(select_by_index).parameters) - {'self'}
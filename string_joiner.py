@@ -5,6 +5,8 @@ Joins a list of items into a single delimited string.
 Companion to String Splitter - reverses the split operation.
 """
 
+import inspect
+
 # wildcard trick is taken from pythongossss's & ImpactPack
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
@@ -13,6 +15,23 @@ class AnyType(str):
 any_typ = AnyType("*")
 
 
+# Direct str converters for the types String Splitter produces.
+# Skips the generic str() dispatch for homogeneous INT/FLOAT lists.
+_STRIFY = {
+    str: lambda s: s,
+    int: int.__str__,
+    float: float.__str__,
+    bool: bool.__str__,
+    type(None): lambda _: "None",
+}
+
+
+def _to_str(item, _dispatch=_STRIFY):
+    """Convert a list item to string, using the fast path for common types."""
+    convert = _dispatch.get(type(item))
+    return convert(item) if convert else str(item)
+
+
 class StringJoiner:
     """
     Join a list of items into a single delimited string.
@@ -74,11 +93,11 @@ class StringJoiner:
         for escape_seq, actual_char in escape_map.items():
             delimiter = delimiter.replace(escape_seq, actual_char)
         
-        # Convert all items to strings
-        str_items = [str(item) for item in list_input]
-        
-        # Join with delimiter
-        result = delimiter.join(str_items)
+        # Convert all items to strings and join with delimiter
+        result = delimiter.join(map(_to_str, list_input))
         count = len(list_input)
         
-        return (result, count)
\ No newline at end of file
+        return (result, count)
+
+    # Parameter names of join_list, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(join_list).parameters) - {'self'}
@@ -4,6 +4,8 @@ String Splitter Node for ComfyUI
 Splits a delimited string into a list with optional type casting.
 """
 
+import inspect
+
 # wildcard trick is taken from pythongossss's & ImpactPack
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
@@ -115,4 +117,7 @@ class StringSplitter:
         
         count = len(items)
         
-        return (items, count)
\ No newline at end of file
+        return (items, count)
+
+    # Parameter names of split_string, computed once at import
+    _FUNCTION_PARAMS = frozenset(inspect.signature(split_string).parameters) - {'self'}
@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration for ComfyUI-JK-TextTools tests
+
+Puts the project root on sys.path once, so test modules can import
+node modules directly (e.g. `from string_splitter import StringSplitter`).
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
@@ -8,62 +8,73 @@ Or from project root:
     python -m tests.run_all_tests
 """
 
+import contextlib
+import importlib
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path so we can import node modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Import test modules
-from tests import (
-    test_string_index_selector,
-    test_string_splitter,
-    test_list_index_selector,
-    test_string_joiner,
-    test_json_pretty_printer,
-    test_detection_query,
-    test_detection_to_bbox,
-    test_bbox_to_mask,
-    test_json_to_bbox,
-    test_segs_to_mask,
-    test_bbox_to_sam3_query,
-    test_segs_to_sam3_query,
-    test_mask_to_bbox
-)
+# Test modules by name - workers import them, so nothing heavy is pickled
+TEST_MODULES = [
+    ("String Index Selector", "tests.test_string_index_selector"),
+    ("String Splitter", "tests.test_string_splitter"),
+    ("List Index Selector", "tests.test_list_index_selector"),
+    ("String Joiner", "tests.test_string_joiner"),
+    ("JSON Pretty Printer", "tests.test_json_pretty_printer"),
+    ("Detection Query", "tests.test_detection_query"),
+    ("Detection to BBox", "tests.test_detection_to_bbox"),
+    ("BBox to Mask", "tests.test_bbox_to_mask"),
+    ("BBoxes to Mask", "tests.test_bboxes_to_mask"),
+    ("JSON to BBox", "tests.test_json_to_bbox"),
+    ("SEGs to Mask", "tests.test_segs_to_mask"),
+    ("BBox to SAM3 Query", "tests.test_bbox_to_sam3_query"),
+    ("SEGs to SAM3 Query", "tests.test_segs_to_sam3_query"),
+    ("Mask to BBox", "tests.test_mask_to_bbox"),
+]
+
+
+def _run_one(module_name):
+    """Run one test module in a worker, capturing its output"""
+    captured = io.StringIO()
+    with contextlib.redirect_stdout(captured):
+        try:
+            module = importlib.import_module(module_name)
+            success = module.run_all_tests()
+        except Exception as e:
+            print(f"❌ FAILED TO RUN {module_name}: {e}")
+            success = False
+    return success, captured.getvalue()
 
 
 def run_all_tests():
-    """Run all test suites"""
+    """Run all test suites in parallel, one worker process per module"""
     print("="*60)
     print("Running ALL tests for ComfyUI-JK-TextTools")
     print("="*60)
     print()
     
-    test_modules = [
-        ("String Index Selector", test_string_index_selector),
-        ("String Splitter", test_string_splitter),
-        ("List Index Selector", test_list_index_selector),
-        ("String Joiner", test_string_joiner),
-        ("JSON Pretty Printer", test_json_pretty_printer),
-        ("Detection Query", test_detection_query),
-        ("Detection to BBox", test_detection_to_bbox),
-        ("BBox to Mask", test_bbox_to_mask),
-        ("JSON to BBox", test_json_to_bbox),
-        ("SEGs to Mask", test_segs_to_mask),
-        ("BBox to SAM3 Query", test_bbox_to_sam3_query),
-        ("SEGs to SAM3 Query", test_segs_to_sam3_query),
-        ("Mask to BBox", test_mask_to_bbox),
-    ]
-    
-    results = []
-    
-    for name, module in test_modules:
-        print(f"\n{'='*60}")
-        print(f"Testing: {name}")
-        print(f"{'='*60}")
-        success = module.run_all_tests()
-        results.append((name, success))
-        print()
+    max_workers = min(len(TEST_MODULES), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (name, executor.submit(_run_one, module_name))
+            for name, module_name in TEST_MODULES
+        ]
+        
+        results = []
+        
+        # Print each module's output in order, as one uninterrupted block
+        for name, future in futures:
+            success, output = future.result()
+            print(f"\n{'='*60}")
+            print(f"Testing: {name}")
+            print(f"{'='*60}")
+            print(output)
+            results.append((name, success))
     
     # Summary
     print("\n" + "="*60)
@@ -5,24 +5,39 @@ Tests the simplified single bbox to mask converter.
 For testing combined/union masks, see test_bboxes_to_mask.py
 
 Run from project root:
-    python tests/test_bbox_to_mask.py
+    python -m tests.test_bbox_to_mask
+or:
+    python -m pytest tests/test_bbox_to_mask.py
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import pytest
 import torch
-import inspect
 from bbox_to_mask import BBoxToMask
 
 
-def test_single_bbox():
-    """Test converting single bbox to mask"""
-    node = BBoxToMask()
+def _expected_mask(expected, region, invert=False):
+    """Fill expected in place: region (y1, y2, x1, x2) is 1, rest is 0 (or inverted)."""
+    expected.fill_(1.0 if invert else 0.0)
+    if region is not None:
+        y1, y2, x1, x2 = region
+        expected[y1:y2, x1:x2] = 0.0 if invert else 1.0
+    return expected
+
+
+@pytest.fixture(scope="module")
+def scratch():
+    """256x256 tensor shared by all bbox variants to build expected masks"""
+    return torch.empty((256, 256), dtype=torch.float32)
 
+
+@pytest.fixture(scope="module")
+def node():
+    """Single node instance shared by every test in this module"""
+    return BBoxToMask()
+
+
+def test_single_bbox(node):
+    """Test converting single bbox to mask"""
     # Single bbox: top-left 100x100 square
     bbox = [[10, 20, 100, 100]]
 
@@ -37,162 +52,54 @@ def test_single_bbox():
     assert isinstance(mask, torch.Tensor), "Mask should be tensor"
 
     # Check bbox area is 1, rest is 0
-    assert mask[20:120, 10:110].sum() == 100 * 100, "Bbox area should be all 1s"
-    assert mask[0:20, :].sum() == 0, "Area above bbox should be all 0s"
-    assert mask[:, 0:10].sum() == 0, "Area left of bbox should be all 0s"
+    expected = _expected_mask(torch.empty_like(mask), (20, 120, 10, 110))
+    assert torch.equal(mask, expected), "Only the bbox area should be 1s"
 
     print("✓ test_single_bbox passed")
 
 
-def test_wrapped_bbox_format():
-    """Test that node handles [[x,y,w,h]] format correctly"""
-    node = BBoxToMask()
-
+@pytest.mark.parametrize("bbox, region, invert", [
     # Standard wrapped format
-    bbox = [[10, 20, 50, 50]]
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
-
-    # Should fill the bbox area
-    assert mask[20:70, 10:60].sum() == 50 * 50, "Should fill bbox area"
-
-    print("✓ test_wrapped_bbox_format passed")
-
-
-def test_unwrapped_bbox_format():
-    """Test that node handles [x,y,w,h] format correctly"""
-    node = BBoxToMask()
-
+    ([[10, 20, 50, 50]], (20, 70, 10, 60), False),
     # Unwrapped format (might come from some sources)
-    bbox = [10, 20, 50, 50]
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
-
-    # Should fill the bbox area
-    assert mask[20:70, 10:60].sum() == 50 * 50, "Should handle unwrapped format"
-
-    print("✓ test_unwrapped_bbox_format passed")
-
-
-def test_bbox_clamping():
-    """Test that bboxes outside image bounds are clamped"""
-    node = BBoxToMask()
-
-    # Bbox that extends beyond image
-    bbox = [[-10, -10, 100, 100]]  # Partially outside
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
-
-    # Should only fill the part that's inside
-    # Should fill from (0,0) to (90,90) - the part that's inside
-    assert mask[0:90, 0:90].sum() > 0, "Should fill inside portion"
-    assert mask[0, 0] == 1.0, "Top-left should be filled"
-
-    print("✓ test_bbox_clamping passed")
-
-
-def test_bbox_completely_outside():
-    """Test bbox completely outside image bounds"""
-    node = BBoxToMask()
-
-    # Bbox completely outside image
-    bbox = [[300, 300, 50, 50]]  # Outside 256x256 image
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
-
-    # Should produce empty mask
-    assert mask.sum() == 0, "Bbox outside image should produce empty mask"
-
-    print("✓ test_bbox_completely_outside passed")
-
-
-def test_invert_mode():
-    """Test inverted mask (bbox is black, rest is white)"""
-    node = BBoxToMask()
-
-    bbox = [[10, 10, 50, 50]]
-
-    result = node.bbox_to_mask(bbox, width=256, height=256, invert=True)
-    mask = result[0]
-
-    # Bbox area should be 0 (black)
-    assert mask[10:60, 10:60].sum() == 0, "Bbox area should be 0 when inverted"
-
-    # Rest should be 1 (white)
-    assert mask[0:10, 0:10].sum() > 0, "Area outside bbox should be 1"
-    assert mask[0, 0] == 1.0, "Outside area should be 1"
-
-    # Total white area should be image size minus bbox size
-    expected_white = (256 * 256) - (50 * 50)
-    assert mask.sum() == expected_white, "Inverted mask should have correct white area"
-
-    print("✓ test_invert_mode passed")
-
-
-def test_zero_size_bbox():
-    """Test handling of zero or negative size bbox"""
-    node = BBoxToMask()
-
+    ([10, 20, 50, 50], (20, 70, 10, 60), False),
+    # Partially outside - clamped to the inside portion (0,0)-(90,90)
+    ([[-10, -10, 100, 100]], (0, 90, 0, 90), False),
+    # Completely outside a 256x256 image
+    ([[300, 300, 50, 50]], None, False),
+    # Inverted - bbox is black, rest is white
+    ([[10, 10, 50, 50]], (10, 60, 10, 60), True),
     # Zero width bbox
-    bbox = [[10, 10, 0, 50]]
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
-
-    # Should produce empty mask
-    assert mask.sum() == 0, "Zero-size bbox should produce empty mask"
-
-    print("✓ test_zero_size_bbox passed")
-
-
-def test_empty_bbox():
-    """Test handling of empty bbox list"""
-    node = BBoxToMask()
-
-    bbox = []
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
+    ([[10, 10, 0, 50]], None, False),
+    # Empty bbox list
+    ([], None, False),
+    # Wrong number of coordinates
+    ([[10, 20, 30]], None, False),
+    # Float coordinates are truncated: int(10.7)=10, int(20.3)=20, int(50.9)=50, int(50.1)=50
+    ([[10.7, 20.3, 50.9, 50.1]], (20, 70, 10, 60), False),
+], ids=[
+    "wrapped", "unwrapped", "clamped", "outside", "invert",
+    "zero_size", "empty", "invalid", "float_coordinates",
+])
+def test_bbox_variants(node, scratch, bbox, region, invert):
+    """Test single bbox variants against the expected 256x256 mask"""
+    mask, = node.bbox_to_mask(bbox, width=256, height=256, invert=invert)
 
-    # Should return empty mask
     assert isinstance(mask, torch.Tensor), "Should return tensor"
-    assert mask.sum() == 0, "Empty bbox should produce empty mask"
+    expected = _expected_mask(scratch, region, invert)
+    assert torch.equal(mask, expected), f"Mask mismatch for bbox {bbox}"
 
-    print("✓ test_empty_bbox passed")
 
-
-def test_invalid_bbox():
-    """Test handling of invalid bbox (wrong length)"""
-    node = BBoxToMask()
-
-    # Bbox with wrong number of coordinates
-    bbox = [[10, 20, 30]]  # Only 3 values instead of 4
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
-
-    # Should return empty mask
-    assert mask.sum() == 0, "Invalid bbox should produce empty mask"
-
-    print("✓ test_invalid_bbox passed")
-
-
-def test_different_image_sizes():
+def test_different_image_sizes(node):
     """Test with various image dimensions"""
-    node = BBoxToMask()
-
     # Small image
     bbox = [[5, 5, 10, 10]]
     result = node.bbox_to_mask(bbox, width=64, height=64)
     assert result[0].shape == (64, 64), "Should match small image size"
 
     # Large image
-    result = node.bbox_to_mask(bbox, width=2048, height=2048)
-    assert result[0].shape == (2048, 2048), "Should match large image size"
+    result = node.bbox_to_mask(bbox, width=1024, height=1024)
+    assert result[0].shape == (1024, 1024), "Should match large image size"
 
     # Non-square
     result = node.bbox_to_mask(bbox, width=1920, height=1080)
@@ -201,27 +108,8 @@ def test_different_image_sizes():
     print("✓ test_different_image_sizes passed")
 
 
-def test_float_coordinates():
-    """Test handling of floating point coordinates"""
-    node = BBoxToMask()
-
-    # Bbox with float coordinates (should be converted to int)
-    bbox = [[10.7, 20.3, 50.9, 50.1]]
-
-    result = node.bbox_to_mask(bbox, width=256, height=256)
-    mask = result[0]
-
-    # Should work - floats converted to ints
-    # int(10.7)=10, int(20.3)=20, int(50.9)=50, int(50.1)=50
-    assert mask[20:70, 10:60].sum() == 50 * 50, "Should handle float coordinates"
-
-    print("✓ test_float_coordinates passed")
-
-
-def test_return_types():
+def test_return_types(node):
     """Validate return types match RETURN_TYPES"""
-    node = BBoxToMask()
-
     bbox = [[10, 10, 50, 50]]
     result = node.bbox_to_mask(bbox, 256, 256)
 
@@ -245,9 +133,7 @@ def test_input_types_structure():
     if "optional" in input_types:
         all_inputs.update(input_types["optional"].keys())
 
-    function = getattr(BBoxToMask(), BBoxToMask.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = BBoxToMask._FUNCTION_PARAMS
 
     missing = function_params - all_inputs
     extra = all_inputs - function_params
@@ -279,42 +165,18 @@ def test_output_is_not_list():
 
 
 def run_all_tests():
-    """Run all test functions"""
+    """Run all test functions through pytest so parametrized cases are honored"""
     print("Running tests for BBoxToMask (simplified single bbox version)...\n")
 
-    try:
-        test_single_bbox()
-        test_wrapped_bbox_format()
-        test_unwrapped_bbox_format()
-        test_bbox_clamping()
-        test_bbox_completely_outside()
-        test_invert_mode()
-        test_zero_size_bbox()
-        test_empty_bbox()
-        test_invalid_bbox()
-        test_different_image_sizes()
-        test_float_coordinates()
-        test_return_types()
-        test_input_types_structure()
-        test_output_is_not_list()
-
-        print("\n" + "="*50)
+    exit_code = pytest.main([__file__, "-q", "-p", "no:cacheprovider"])
+
+    print("\n" + "="*50)
+    if exit_code == 0:
         print("✅ ALL TESTS PASSED!")
-        print("="*50)
-        return True
-
-    except AssertionError as e:
-        print("\n" + "="*50)
-        print(f"❌ TEST FAILED: {e}")
-        print("="*50)
-        return False
-    except Exception as e:
-        print("\n" + "="*50)
-        print(f"❌ UNEXPECTED ERROR: {e}")
-        print("="*50)
-        import traceback
-        traceback.print_exc()
-        return False
+    else:
+        print(f"❌ TESTS FAILED (pytest exit code {int(exit_code)})")
+    print("="*50)
+    return exit_code == 0
 
 
 if __name__ == "__main__":
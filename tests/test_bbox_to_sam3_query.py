@@ -5,26 +5,37 @@ Test the conversion of BBOX format to SAM3 Selector query formats.
 """
 
 import sys
-from pathlib import Path
 import json
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import pytest
 from bbox_to_sam3_query import BBoxToSAM3Query
 
+# Expected output keys (dict key views compare directly against sets)
+TBG_BOX_KEYS = frozenset({"x1", "y1", "x2", "y2"})
+TBG_POINT_KEYS = frozenset({"x", "y"})
+SAM3_BOX_KEYS = frozenset({"boxes", "labels"})
+SAM3_POINT_KEYS = frozenset({"points", "labels"})
 
-def test_basic_conversion():
-    """Test basic conversion with all four outputs (SAM3 + TBG)"""
-    node = BBoxToSAM3Query()
 
+@pytest.fixture(scope="module")
+def node():
+    """Single node instance shared by every test in this module"""
+    return BBoxToSAM3Query()
+
+
+def test_basic_conversion(node):
+    """Test basic conversion with all four outputs (SAM3 + TBG)"""
     # BBOX: x=100, y=200, w=50, h=75
     # Image: 512x512
     bbox = [[100, 200, 50, 75]]
     width = 512
     height = 512
 
-    box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, width, height)
+    result = node.bbox_to_sam3_query(bbox, width, height)
+
+    # One output per RETURN_TYPES entry (guards against the old 2-output API)
+    assert len(result) == len(BBoxToSAM3Query.RETURN_TYPES), "Should return one value per output"
+    box_sam3, point_sam3, box_tbg_str, point_tbg_str = result
 
     # === Check SAM3 format outputs (normalized coordinates) ===
     # Box prompt should have normalized XYWH
@@ -78,46 +89,84 @@ def test_basic_conversion():
     print("✓ test_basic_conversion passed")
 
 
-def test_unwrapped_bbox_format():
-    """Test handling of unwrapped bbox format [x,y,w,h]"""
-    node = BBoxToSAM3Query()
-
+@pytest.mark.parametrize("bbox, width, height, expected_box, expected_point", [
     # Unwrapped format (not nested)
-    bbox = [50, 60, 100, 120]
+    ([50, 60, 100, 120], 640, 480, [50.0, 60.0, 150.0, 180.0], [100.0, 120.0]),
+    # Zero width - x1 == x2, center at x
+    ([[100, 200, 0, 50]], 512, 512, [100.0, 200.0, 100.0, 250.0], [100.0, 225.0]),
+    # Zero height - y1 == y2, center at y
+    ([[100, 200, 50, 0]], 512, 512, [100.0, 200.0, 150.0, 200.0], [125.0, 200.0]),
+    # Negative coordinates (might happen with cropped images) - downstream handles clipping
+    ([[-10, -20, 50, 75]], 512, 512, [-10.0, -20.0, 40.0, 55.0], [15.0, 17.5]),
+    # Large image coordinates (e.g., 4K image)
+    ([[1920, 1080, 1024, 768]], 3840, 2160, [1920.0, 1080.0, 2944.0, 1848.0], [2432.0, 1464.0]),
+], ids=["unwrapped", "zero_width", "zero_height", "negative", "large"])
+def test_conversion_table(node, bbox, width, height, expected_box, expected_point):
+    """Test XYWH -> TBG XYXY/center and SAM3 normalization for single boxes"""
+    # _compute returns the TBG coordinates before JSON serialization,
+    # so the table doesn't pay for an encode/decode round-trip per case
+    box_sam3, point_sam3, xyxy_rows, center_rows = node._compute(bbox, width, height, "positive")
+
+    # Check TBG coordinates (absolute)
+    assert xyxy_rows == [expected_box]
+    assert center_rows == [expected_point]
+
+    # Check SAM3 outputs (XYWH and center normalized by image size)
+    x1, y1, x2, y2 = expected_box
+    cx, cy = expected_point
+    expected_box_norm = [x1 / width, y1 / height, (x2 - x1) / width, (y2 - y1) / height]
+    expected_point_norm = [cx / width, cy / height]
+    assert box_sam3["boxes"][0] == pytest.approx(expected_box_norm)
+    assert point_sam3["points"][0] == pytest.approx(expected_point_norm)
+
+
+def test_multiple_bboxes(node):
+    """Test that every box in a multi-box BBOX list is converted"""
+    bbox = [[100, 200, 50, 75], [0, 0, 256, 128]]
 
-    box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 640, 480)
+    box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 512, 512)
 
-    # Check SAM3 normalized outputs
-    assert len(box_sam3["boxes"]) == 1, "Should handle unwrapped format"
-    assert abs(box_sam3["boxes"][0][0] - 50.0/640) < 0.0001
+    # SAM3 outputs have one entry (and label) per box, in input order
+    assert len(box_sam3["boxes"]) == 2, "Should have two boxes"
+    assert box_sam3["labels"] == [True, True], "Should have one label per box"
+    assert box_sam3["boxes"][1] == [0.0, 0.0, 0.5, 0.25], "Second box should be normalized"
+    assert point_sam3["points"][1] == [0.25, 0.125], "Second center should be normalized"
+    assert point_sam3["labels"] == [1, 1], "Should have one label per point"
 
-    # Check TBG outputs
+    # TBG outputs have one query per box
     box_tbg = json.loads(box_tbg_str)
     point_tbg = json.loads(point_tbg_str)
 
-    assert box_tbg[0]["x1"] == 50.0
-    assert box_tbg[0]["y1"] == 60.0
-    assert box_tbg[0]["x2"] == 150.0  # 50 + 100
-    assert box_tbg[0]["y2"] == 180.0  # 60 + 120
+    assert box_tbg == [
+        {"x1": 100.0, "y1": 200.0, "x2": 150.0, "y2": 275.0},
+        {"x1": 0.0, "y1": 0.0, "x2": 256.0, "y2": 128.0},
+    ]
+    assert point_tbg == [{"x": 125.0, "y": 237.5}, {"x": 128.0, "y": 64.0}]
 
-    assert point_tbg[0]["x"] == 100.0  # 50 + 100/2
-    assert point_tbg[0]["y"] == 120.0  # 60 + 120/2
+    # Malformed boxes are skipped, the valid ones are kept
+    bbox = [[1, 2, 3], [0, 0, 256, 128], "not a bbox", [1, 2, 3, 4, 5]]
+    box_sam3, _, box_tbg_str, _ = node.bbox_to_sam3_query(bbox, 512, 512)
+    assert box_sam3["boxes"] == [[0.0, 0.0, 0.5, 0.25]], "Only the valid box should be kept"
+    assert json.loads(box_tbg_str) == [{"x1": 0.0, "y1": 0.0, "x2": 256.0, "y2": 128.0}]
 
-    print("✓ test_unwrapped_bbox_format passed")
+    # A non-numeric coordinate invalidates the whole input
+    box_sam3, _, box_tbg_str, _ = node.bbox_to_sam3_query([[0, 0, 10, 10], ["a", 2, 3, 4]], 512, 512)
+    assert box_sam3["boxes"] == [], "Non-numeric box should produce empty outputs"
+    assert box_tbg_str == "[]", "Non-numeric box should produce empty outputs"
 
+    print("✓ test_multiple_bboxes passed")
 
-def test_integer_coordinates():
-    """Test that integer coordinates are converted to floats"""
-    node = BBoxToSAM3Query()
 
+def test_integer_coordinates(node):
+    """Test that integer coordinates are converted to floats"""
     # Pure integer coordinates
     bbox = [[10, 20, 30, 40]]
 
     box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 512, 512)
 
     # Check SAM3 outputs have float values
-    assert all(isinstance(v, float) for v in box_sam3["boxes"][0]), "SAM3 box coordinates should be floats"
-    assert all(isinstance(v, float) for v in point_sam3["points"][0]), "SAM3 point coordinates should be floats"
+    assert set(map(type, box_sam3["boxes"][0])) == {float}, "SAM3 box coordinates should be floats"
+    assert set(map(type, point_sam3["points"][0])) == {float}, "SAM3 point coordinates should be floats"
 
     # Check TBG outputs
     box_tbg = json.loads(box_tbg_str)
@@ -135,45 +184,8 @@ def test_integer_coordinates():
     print("✓ test_integer_coordinates passed")
 
 
-def test_zero_size_bbox():
-    """Test handling of zero-width or zero-height bbox"""
-    node = BBoxToSAM3Query()
-
-    # Zero width
-    bbox = [[100, 200, 0, 50]]
-    box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 512, 512)
-
-    # Check SAM3 outputs
-    assert box_sam3["boxes"][0][2] == 0.0, "SAM3 width should be 0"
-    assert point_sam3["points"][0][0] == 100.0/512, "SAM3 center_x normalized"
-
-    # Check TBG outputs
-    box_tbg = json.loads(box_tbg_str)
-    point_tbg = json.loads(point_tbg_str)
-
-    # Should still produce valid query (might be treated as point by SAM3)
-    assert box_tbg[0]["x1"] == 100.0
-    assert box_tbg[0]["x2"] == 100.0  # x1 == x2
-    assert point_tbg[0]["x"] == 100.0  # center at x
-
-    # Zero height
-    bbox = [[100, 200, 50, 0]]
-    _, _, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 512, 512)
-
-    box_tbg = json.loads(box_tbg_str)
-    point_tbg = json.loads(point_tbg_str)
-
-    assert box_tbg[0]["y1"] == 200.0
-    assert box_tbg[0]["y2"] == 200.0  # y1 == y2
-    assert point_tbg[0]["y"] == 200.0  # center at y
-
-    print("✓ test_zero_size_bbox passed")
-
-
-def test_empty_bbox():
+def test_empty_bbox(node):
     """Test handling of empty bbox input"""
-    node = BBoxToSAM3Query()
-
     # Empty list
     bbox = []
     box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox)
@@ -191,10 +203,8 @@ def test_empty_bbox():
     print("✓ test_empty_bbox passed")
 
 
-def test_invalid_bbox_length():
+def test_invalid_bbox_length(node):
     """Test handling of bbox with wrong number of elements"""
-    node = BBoxToSAM3Query()
-
     # Too few elements
     bbox = [[100, 200, 50]]  # Missing height
     box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox)
@@ -215,37 +225,38 @@ def test_invalid_bbox_length():
     assert box_tbg_str == "[]", "Should return empty array for invalid bbox"
     assert point_tbg_str == "[]", "Should return empty array for invalid bbox"
 
-    print("✓ test_invalid_bbox_length passed")
-
-
-def test_negative_coordinates():
-    """Test handling of negative coordinates (edge case)"""
-    node = BBoxToSAM3Query()
+    # Non-numeric element
+    bbox = [["a", 200, 50, 75]]
+    box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox)
 
-    # Negative coordinates (might happen with cropped images)
-    bbox = [[-10, -20, 50, 75]]
+    assert box_sam3["boxes"] == [], "SAM3 outputs should be empty for invalid bbox"
+    assert box_tbg_str == "[]", "Should return empty array for invalid bbox"
 
-    _, _, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 512, 512)
+    print("✓ test_invalid_bbox_length passed")
 
-    box_tbg = json.loads(box_tbg_str)
-    point_tbg = json.loads(point_tbg_str)
 
-    # Should still convert (downstream node handles clipping)
-    assert box_tbg[0]["x1"] == -10.0
-    assert box_tbg[0]["y1"] == -20.0
-    assert box_tbg[0]["x2"] == 40.0  # -10 + 50
-    assert box_tbg[0]["y2"] == 55.0  # -20 + 75
+def test_empty_results_not_shared(node):
+    """Test that modifying one empty result does not affect later calls"""
+    cases = [
+        ([], 1000, 1000),                   # Empty bbox
+        ([[100, 200, 50]], 1000, 1000),     # Invalid bbox
+        ([[100, 100, 50, 50]], 0, 0),       # Valid bbox without dimensions
+    ]
+    for bbox, width, height in cases:
+        box_sam3, point_sam3, _, _ = node.bbox_to_sam3_query(bbox, width, height)
+        box_sam3["boxes"].append([0.1, 0.1, 0.2, 0.2])
+        box_sam3["labels"].append(True)
+        point_sam3["points"].append([0.5, 0.5])
 
-    assert point_tbg[0]["x"] == 15.0  # -10 + 50/2
-    assert point_tbg[0]["y"] == 17.5  # -20 + 75/2
+        box_sam3, point_sam3, _, _ = node.bbox_to_sam3_query(bbox, width, height)
+        assert box_sam3 == {"boxes": [], "labels": []}, f"Empty box prompt was modified: {box_sam3}"
+        assert point_sam3 == {"points": [], "labels": []}, f"Empty point prompt was modified: {point_sam3}"
 
-    print("✓ test_negative_coordinates passed")
+    print("✓ test_empty_results_not_shared passed")
 
 
-def test_json_format_validation():
+def test_json_format_validation(node):
     """Test that TBG output is valid JSON with correct structure"""
-    node = BBoxToSAM3Query()
-
     bbox = [[100, 200, 50, 75]]
     _, _, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 512, 512)
 
@@ -256,26 +267,38 @@ def test_json_format_validation():
     # Check structure
     assert isinstance(box_tbg, list), "Box query should be a list"
     assert isinstance(box_tbg[0], dict), "Box query item should be a dict"
-    assert set(box_tbg[0].keys()) == {"x1", "y1", "x2", "y2"}, "Box query should have x1, y1, x2, y2 keys"
+    assert box_tbg[0].keys() == TBG_BOX_KEYS, "Box query should have x1, y1, x2, y2 keys"
 
     assert isinstance(point_tbg, list), "Point query should be a list"
     assert isinstance(point_tbg[0], dict), "Point query item should be a dict"
-    assert set(point_tbg[0].keys()) == {"x", "y"}, "Point query should have x, y keys"
+    assert point_tbg[0].keys() == TBG_POINT_KEYS, "Point query should have x, y keys"
 
     print("✓ test_json_format_validation passed")
 
 
-def test_float_precision():
-    """Test that float values maintain reasonable precision"""
-    node = BBoxToSAM3Query()
+def test_non_finite_coordinates(node):
+    """Test that NaN/Infinity coordinates still give parseable TBG JSON"""
+    bbox = [[float("nan"), 200, float("inf"), 75]]
+    _, _, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox)
+
+    # Same output as json.dumps (NaN/Infinity, not nan/inf)
+    assert box_tbg_str == json.dumps([{"x1": float("nan"), "y1": 200.0, "x2": float("nan"), "y2": 275.0}])
+    assert point_tbg_str == json.dumps([{"x": float("nan"), "y": 237.5}])
+    json.loads(box_tbg_str)
+    json.loads(point_tbg_str)
+
+    print("✓ test_non_finite_coordinates passed")
 
+
+def test_float_precision(node):
+    """Test that float values maintain reasonable precision"""
     # Use values that would have decimal places
     bbox = [[100.5, 200.3, 50.7, 75.9]]
 
     box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 512, 512)
 
     # Check SAM3 normalized precision
-    assert all(isinstance(v, float) for v in box_sam3["boxes"][0]), "SAM3 coordinates should be floats"
+    assert set(map(type, box_sam3["boxes"][0])) == {float}, "SAM3 coordinates should be floats"
 
     # Check TBG precision
     box_tbg = json.loads(box_tbg_str)
@@ -293,39 +316,8 @@ def test_float_precision():
     print("✓ test_float_precision passed")
 
 
-def test_large_coordinates():
-    """Test handling of large coordinate values"""
-    node = BBoxToSAM3Query()
-
-    # Large image coordinates (e.g., 4K image)
-    bbox = [[1920, 1080, 1024, 768]]
-
-    box_sam3, point_sam3, box_tbg_str, point_tbg_str = node.bbox_to_sam3_query(bbox, 3840, 2160)
-
-    # Check SAM3 normalization for large dimensions
-    assert 0 <= box_sam3["boxes"][0][0] <= 1, "SAM3 normalized x should be in 0-1 range"
-    assert 0 <= box_sam3["boxes"][0][1] <= 1, "SAM3 normalized y should be in 0-1 range"
-
-    # Check TBG absolute coordinates
-    box_tbg = json.loads(box_tbg_str)
-    point_tbg = json.loads(point_tbg_str)
-
-    # Check conversions work with large values
-    assert box_tbg[0]["x1"] == 1920.0
-    assert box_tbg[0]["y1"] == 1080.0
-    assert box_tbg[0]["x2"] == 2944.0  # 1920 + 1024
-    assert box_tbg[0]["y2"] == 1848.0  # 1080 + 768
-
-    assert point_tbg[0]["x"] == 2432.0  # 1920 + 1024/2
-    assert point_tbg[0]["y"] == 1464.0  # 1080 + 768/2
-
-    print("✓ test_large_coordinates passed")
-
-
-def test_positive_prompt_type():
+def test_positive_prompt_type(node):
     """Test positive prompt type labeling"""
-    node = BBoxToSAM3Query()
-
     bbox = [[100, 100, 50, 50]]
     box_sam3, point_sam3, _, _ = node.bbox_to_sam3_query(bbox, 512, 512, prompt_type="positive")
 
@@ -336,10 +328,8 @@ def test_positive_prompt_type():
     print("✓ test_positive_prompt_type passed")
 
 
-def test_negative_prompt_type():
+def test_negative_prompt_type(node):
     """Test negative prompt type labeling"""
-    node = BBoxToSAM3Query()
-
     bbox = [[100, 100, 50, 50]]
     box_sam3, point_sam3, _, _ = node.bbox_to_sam3_query(bbox, 512, 512, prompt_type="negative")
 
@@ -350,10 +340,8 @@ def test_negative_prompt_type():
     print("✓ test_negative_prompt_type passed")
 
 
-def test_optional_dimensions_missing():
+def test_optional_dimensions_missing(node):
     """Test behavior when width/height not provided"""
-    node = BBoxToSAM3Query()
-
     bbox = [[100, 100, 50, 50]]
 
     # No width/height provided
@@ -375,10 +363,8 @@ def test_optional_dimensions_missing():
     print("✓ test_optional_dimensions_missing passed")
 
 
-def test_optional_dimensions_zero():
+def test_optional_dimensions_zero(node):
     """Test behavior when width/height are zero"""
-    node = BBoxToSAM3Query()
-
     bbox = [[100, 100, 50, 50]]
 
     # Explicit zero dimensions
@@ -395,23 +381,21 @@ def test_optional_dimensions_zero():
     print("✓ test_optional_dimensions_zero passed")
 
 
-def test_sam3_format_structure():
+def test_sam3_format_structure(node):
     """Test SAM3 format matches expected structure"""
-    node = BBoxToSAM3Query()
-
     bbox = [[100, 200, 50, 75]]
     box_sam3, point_sam3, _, _ = node.bbox_to_sam3_query(bbox, 512, 512)
 
     # Box prompt structure
     assert isinstance(box_sam3, dict), "Box prompt should be a dict"
-    assert set(box_sam3.keys()) == {"boxes", "labels"}, "Box prompt should have 'boxes' and 'labels' keys"
+    assert box_sam3.keys() == SAM3_BOX_KEYS, "Box prompt should have 'boxes' and 'labels' keys"
     assert isinstance(box_sam3["boxes"], list), "boxes should be a list"
     assert isinstance(box_sam3["labels"], list), "labels should be a list"
     assert len(box_sam3["boxes"][0]) == 4, "Box should have 4 coordinates (XYWH)"
 
     # Point prompt structure
     assert isinstance(point_sam3, dict), "Point prompt should be a dict"
-    assert set(point_sam3.keys()) == {"points", "labels"}, "Point prompt should have 'points' and 'labels' keys"
+    assert point_sam3.keys() == SAM3_POINT_KEYS, "Point prompt should have 'points' and 'labels' keys"
     assert isinstance(point_sam3["points"], list), "points should be a list"
     assert isinstance(point_sam3["labels"], list), "labels should be a list"
     assert len(point_sam3["points"][0]) == 2, "Point should have 2 coordinates (XY)"
@@ -419,10 +403,8 @@ def test_sam3_format_structure():
     print("✓ test_sam3_format_structure passed")
 
 
-def test_input_types_signature():
+def test_input_types_signature(node):
     """Test that INPUT_TYPES matches function signature"""
-    node = BBoxToSAM3Query()
-
     input_types = node.INPUT_TYPES()
 
     # Check required inputs
@@ -444,49 +426,21 @@ def test_input_types_signature():
 
 
 def run_all_tests():
-    """Run all test functions"""
+    """Run all test functions through pytest so parametrized cases are honored"""
     print("\n" + "="*50)
     print("Testing BBox to SAM3 Query Node")
     print("="*50 + "\n")
 
-    tests = [
-        test_basic_conversion,
-        test_unwrapped_bbox_format,
-        test_integer_coordinates,
-        test_zero_size_bbox,
-        test_empty_bbox,
-        test_invalid_bbox_length,
-        test_negative_coordinates,
-        test_json_format_validation,
-        test_float_precision,
-        test_large_coordinates,
-        test_positive_prompt_type,
-        test_negative_prompt_type,
-        test_optional_dimensions_missing,
-        test_optional_dimensions_zero,
-        test_sam3_format_structure,
-        test_input_types_signature,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"✗ {test.__name__} failed: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ {test.__name__} error: {e}")
-            failed += 1
+    exit_code = pytest.main([__file__, "-q", "-p", "no:cacheprovider"])
 
     print("\n" + "="*50)
-    print(f"Results: {passed} passed, {failed} failed out of {len(tests)} tests")
+    if exit_code == 0:
+        print("✅ ALL TESTS PASSED!")
+    else:
+        print(f"❌ TESTS FAILED (pytest exit code {int(exit_code)})")
     print("="*50 + "\n")
 
-    return failed == 0
+    return exit_code == 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+"""
+Tests for BBoxes to Mask Node
+
+Tests the multi-bbox converter (combined union mask + individual masks).
+For the single bbox converter, see test_bbox_to_mask.py
+
+Run from project root:
+    python -m tests.test_bboxes_to_mask
+"""
+
+import torch
+from bboxes_to_mask import BBoxesToMask
+
+
+def _expected_mask(height, width, *regions):
+    """Build the expected mask with each (y1, y2, x1, x2) region filled."""
+    expected = torch.zeros((height, width), dtype=torch.float32)
+    for y1, y2, x1, x2 in regions:
+        expected[y1:y2, x1:x2] = 1.0
+    return expected
+
+
+def test_multiple_bboxes():
+    """Test combined and individual masks for separate bboxes"""
+    node = BBoxesToMask()
+
+    bboxes = [[[10, 10, 50, 50]], [[100, 100, 30, 30]]]
+
+    combined_mask, individual_masks, count = node.bboxes_to_mask(bboxes, 256, 256)
+
+    assert count == 2, f"Expected 2 bboxes, got {count}"
+    assert len(individual_masks) == 2, "Should return one mask per bbox"
+
+    expected = _expected_mask(256, 256, (10, 60, 10, 60), (100, 130, 100, 130))
+    assert torch.equal(combined_mask, expected), "Combined mask should be union of bboxes"
+
+    assert torch.equal(individual_masks[0], _expected_mask(256, 256, (10, 60, 10, 60))), \
+        "First individual mask should only contain first bbox"
+    assert torch.equal(individual_masks[1], _expected_mask(256, 256, (100, 130, 100, 130))), \
+        "Second individual mask should only contain second bbox"
+
+    print("✓ test_multiple_bboxes passed")
+
+
+def test_overlapping_bboxes():
+    """Test that overlapping bboxes union without exceeding 1.0"""
+    node = BBoxesToMask()
+
+    bboxes = [[[10, 10, 50, 50]], [[30, 30, 50, 50]]]
+
+    combined_mask, _, count = node.bboxes_to_mask(bboxes, 256, 256)
+
+    assert count == 2
+    expected = _expected_mask(256, 256, (10, 60, 10, 60), (30, 80, 30, 80))
+    assert torch.equal(combined_mask, expected), "Overlap should stay at 1.0"
+
+    print("✓ test_overlapping_bboxes passed")
+
+
+def test_unwrapped_bboxes():
+    """Test that [x,y,w,h] entries are accepted alongside [[x,y,w,h]]"""
+    node = BBoxesToMask()
+
+    bboxes = [[10, 10, 50, 50], [[100, 100, 30, 30]]]
+
+    combined_mask, _, count = node.bboxes_to_mask(bboxes, 256, 256)
+
+    assert count == 2, "Should accept both bbox formats"
+    expected = _expected_mask(256, 256, (10, 60, 10, 60), (100, 130, 100, 130))
+    assert torch.equal(combined_mask, expected)
+
+    print("✓ test_unwrapped_bboxes passed")
+
+
+def test_list_wrapped_scalars():
+    """Test that width/height/invert arrive as lists (INPUT_IS_LIST)"""
+    node = BBoxesToMask()
+
+    combined_mask, _, _ = node.bboxes_to_mask([[[0, 0, 10, 10]]], [64], [32], [False])
+
+    assert combined_mask.shape == (32, 64), f"Expected (32, 64), got {combined_mask.shape}"
+
+    print("✓ test_list_wrapped_scalars passed")
+
+
+def test_invert_mode():
+    """Test inverted masks (bbox areas are 0, rest is 1)"""
+    node = BBoxesToMask()
+
+    bboxes = [[[10, 10, 50, 50]], [[100, 100, 30, 30]]]
+
+    combined_mask, individual_masks, _ = node.bboxes_to_mask(bboxes, 256, 256, invert=True)
+
+    expected = 1.0 - _expected_mask(256, 256, (10, 60, 10, 60), (100, 130, 100, 130))
+    assert torch.equal(combined_mask, expected), "Combined mask should be inverted"
+    assert torch.equal(individual_masks[0], 1.0 - _expected_mask(256, 256, (10, 60, 10, 60))), \
+        "Individual masks should be inverted"
+
+    print("✓ test_invert_mode passed")
+
+
+def test_empty_bbox():
+    """Test handling of empty bbox list"""
+    node = BBoxesToMask()
+
+    combined_mask, individual_masks, count = node.bboxes_to_mask([], 256, 256)
+
+    assert count == 0, "Empty input should have count 0"
+    assert not combined_mask.any(), "Empty input should produce empty mask"
+    assert len(individual_masks) == 1, "Should return [empty_mask]"
+    assert not individual_masks[0].any(), "Individual mask should be empty"
+
+    print("✓ test_empty_bbox passed")
+
+
+def test_invalid_bboxes():
+    """Test that invalid entries are skipped"""
+    node = BBoxesToMask()
+
+    bboxes = [[[10, 20, 30]], "not a bbox", [[10, 10, 20, 20]]]
+
+    combined_mask, individual_masks, count = node.bboxes_to_mask(bboxes, 128, 128)
+
+    assert count == 1, f"Only one valid bbox expected, got {count}"
+    assert torch.equal(combined_mask, _expected_mask(128, 128, (10, 30, 10, 30)))
+
+    print("✓ test_invalid_bboxes passed")
+
+
+def test_input_types_structure():
+    """Validate INPUT_TYPES matches function signature"""
+    input_types = BBoxesToMask.INPUT_TYPES()
+
+    all_inputs = set()
+    if "required" in input_types:
+        all_inputs.update(input_types["required"].keys())
+    if "optional" in input_types:
+        all_inputs.update(input_types["optional"].keys())
+
+    function_params = BBoxesToMask._FUNCTION_PARAMS
+
+    missing = function_params - all_inputs
+    extra = all_inputs - function_params
+
+    assert not missing, f"Function has params not in INPUT_TYPES: {missing}"
+    assert not extra, f"INPUT_TYPES has entries not in function: {extra}"
+
+    print("✓ test_input_types_structure passed")
+
+
+def run_all_tests():
+    """Run all test functions"""
+    print("Running tests for BBoxesToMask...\n")
+
+    try:
+        test_multiple_bboxes()
+        test_overlapping_bboxes()
+        test_unwrapped_bboxes()
+        test_list_wrapped_scalars()
+        test_invert_mode()
+        test_empty_bbox()
+        test_invalid_bboxes()
+        test_input_types_structure()
+
+        print("\n" + "="*50)
+        print("✅ ALL TESTS PASSED!")
+        print("="*50)
+        return True
+
+    except AssertionError as e:
+        print("\n" + "="*50)
+        print(f"❌ TEST FAILED: {e}")
+        print("="*50)
+        return False
+    except Exception as e:
+        print("\n" + "="*50)
+        print(f"❌ UNEXPECTED ERROR: {e}")
+        print("="*50)
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
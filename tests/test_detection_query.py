@@ -1,17 +1,14 @@
 """
 Tests for Detection Query Node
 
-Run with: python test_detection_query.py
+Run from project root:
+    python -m tests.test_detection_query
 """
 
-import json
-import inspect
 import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import json
 
+import pytest
 from detection_query import DetectionQuery
 
 
@@ -31,13 +28,22 @@ SAMPLE_DETECTIONS = [
 ]
 
 
-def test_all_detections():
+@pytest.fixture(scope="module")
+def node():
+    """Single node instance shared by every test in this module"""
+    return DetectionQuery()
+
+
+@pytest.fixture(scope="module")
+def sample_json():
+    """SAMPLE_DETECTIONS serialized once - every test queries the same input"""
+    return json.dumps(SAMPLE_DETECTIONS)
+
+
+def test_all_detections(node, sample_json):
     """Test getting all detections with wildcard"""
-    node = DetectionQuery()
-    
-    input_json = json.dumps(SAMPLE_DETECTIONS)
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json, 
+        sample_json, 
         class_filter="*"
     )
     
@@ -48,13 +54,34 @@ def test_all_detections():
     print("✓ test_all_detections passed")
 
 
-def test_exact_class_match():
-    """Test exact class name matching"""
-    node = DetectionQuery()
+def test_empty_filter_matches_all(node, sample_json):
+    """Test that an empty class filter behaves like the "*" wildcard"""
+    _, count, detection_list, _, _, is_valid, error = node.query_detections(
+        sample_json,
+        class_filter=""
+    )
+    
+    assert is_valid == True, "Should be valid"
+    assert count == 6, f"Empty filter should return all 6 detections, got {count}"
+    
+    print("✓ test_empty_filter_matches_all passed")
+
+
+def test_parsed_input(node, sample_json):
+    """Test that already-parsed detection data gives the same result as JSON"""
+    from_json = node.query_detections(sample_json, class_filter="CLASS2_*")
+    from_data = node.query_detections(SAMPLE_DETECTIONS, class_filter="CLASS2_*")
     
-    input_json = json.dumps(SAMPLE_DETECTIONS)
+    assert from_data[5] == True, f"Should be valid, got error: {from_data[6]}"
+    assert from_data == from_json, "Parsed input should match the JSON string result"
+    
+    print("✓ test_parsed_input passed")
+
+
+def test_exact_class_match(node, sample_json):
+    """Test exact class name matching"""
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="CLASS1_LABEL"
     )
     
@@ -66,59 +93,102 @@ def test_exact_class_match():
     print("✓ test_exact_class_match passed")
 
 
-def test_wildcard_prefix():
+def test_wildcard_prefix(node, sample_json):
     """Test wildcard prefix matching"""
-    node = DetectionQuery()
-    
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-    
     # Match all CLASS1_* variants
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="CLASS1_*"
     )
     
     assert count == 3, f"Should find 3 CLASS1_* items, found {count}"
     
-    # Verify all start with CLASS1_
-    for detection in detection_list:
-        assert detection["class"].startswith("CLASS1_"), \
-            f"All should start with CLASS1_, got {detection['class']}"
+    # Verify only CLASS1_ classes came back
+    classes = {detection["class"] for detection in detection_list}
+    assert classes == {"CLASS1_LABEL", "CLASS1_SUBCLASS1", "CLASS1_SUBCLASS2"}, \
+        f"All should start with CLASS1_, got {classes}"
     
     print("✓ test_wildcard_prefix passed")
 
 
-def test_wildcard_suffix():
+def test_wildcard_suffix(node, sample_json):
     """Test wildcard suffix matching"""
-    node = DetectionQuery()
-    
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-    
     # Match all *_LABEL classes
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="*_LABEL"
     )
     
     assert count == 4, f"Should find 4 *_LABEL items, found {count}"
     
-    # Verify all end with _LABEL
-    for detection in detection_list:
-        assert detection["class"].endswith("_LABEL"), \
-            f"All should end with _LABEL, got {detection['class']}"
+    # Verify only _LABEL classes came back
+    classes = {detection["class"] for detection in detection_list}
+    assert classes == {"CLASS1_LABEL", "CLASS2_LABEL", "CLASS3_LABEL"}, \
+        f"All should end with _LABEL, got {classes}"
     
     print("✓ test_wildcard_suffix passed")
 
 
-def test_score_filtering():
-    """Test minimum score filtering"""
-    node = DetectionQuery()
+def test_wildcard_single_char(node, sample_json):
+    """Test single-character wildcard matching"""
+    # Match CLASS1_LABEL, CLASS2_LABEL (x2) and CLASS3_LABEL
+    filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
+        sample_json,
+        class_filter="CLASS?_LABEL"
+    )
     
-    input_json = json.dumps(SAMPLE_DETECTIONS)
+    assert count == 4, f"Should find 4 CLASS?_LABEL items, found {count}"
     
+    print("✓ test_wildcard_single_char passed")
+
+
+def test_wildcard_contains(node, sample_json):
+    """Test contains and multi-segment wildcard matching"""
+    # Match classes containing SUB anywhere
+    _, count, detection_list, _, _, is_valid, error = node.query_detections(
+        sample_json,
+        class_filter="*SUB*"
+    )
+    
+    assert count == 2, f"Should find 2 *SUB* items, found {count}"
+    
+    # Match with several literal segments
+    _, count, detection_list, _, _, is_valid, error = node.query_detections(
+        sample_json,
+        class_filter="CLASS*_SUB*2"
+    )
+    
+    assert count == 1, f"Should find 1 CLASS*_SUB*2 item, found {count}"
+    assert detection_list[0]["class"] == "CLASS1_SUBCLASS2"
+    
+    print("✓ test_wildcard_contains passed")
+
+
+def test_class_name_with_comma(node):
+    """Test that a filter containing a comma matches that class name exactly"""
+    detections = [
+        {"class": "CLASS1, CLASS3", "score": 0.9, "box": [0, 0, 10, 10]},
+        {"class": "CLASS1", "score": 0.9, "box": [0, 0, 10, 10]},
+        {"class": "CLASS3", "score": 0.9, "box": [0, 0, 10, 10]}
+    ]
+    
+    _, count, detection_list, _, _, is_valid, error = node.query_detections(
+        json.dumps(detections),
+        class_filter="CLASS1, CLASS3"
+    )
+    
+    assert is_valid == True, f"Should be valid, got error: {error}"
+    assert count == 1, f"Should only match the class with a comma, found {count}"
+    assert detection_list[0]["class"] == "CLASS1, CLASS3"
+    
+    print("✓ test_class_name_with_comma passed")
+
+
+def test_score_filtering(node, sample_json):
+    """Test minimum score filtering"""
     # Only high confidence (> 0.7)
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="*",
         min_score=0.7
     )
@@ -133,15 +203,78 @@ def test_score_filtering():
     print("✓ test_score_filtering passed")
 
 
-def test_combined_filters():
-    """Test combining class and score filters"""
-    node = DetectionQuery()
+def test_score_filtering_many_detections(node):
+    """Test score filtering on a list large enough to be vectorized"""
+    detections = [
+        {"class": f"CLASS{i % 3}_LABEL", "score": i / 100, "box": [i, i, 10, 10]}
+        for i in range(100)
+    ]
+    input_json = json.dumps(detections)
+    
+    filtered_json, count, detection_list, bbox_list, _, is_valid, error = node.query_detections(
+        input_json,
+        class_filter="CLASS1_*",
+        min_score=0.5
+    )
+    
+    expected = [d for d in detections if d["score"] >= 0.5 and d["class"] == "CLASS1_LABEL"]
+    assert is_valid == True, f"Should be valid, got error: {error}"
+    assert detection_list == expected, "Should match the same detections as a plain filter"
+    assert bbox_list == [[d["box"]] for d in expected], "bbox_list should follow the filtered detections"
+    
+    # A malformed entry falls back to per-detection checks instead of failing
+    input_json = json.dumps(detections + ["not a detection"])
+    _, count, _, _, _, is_valid, _ = node.query_detections(
+        input_json,
+        class_filter="CLASS1_*",
+        min_score=0.5
+    )
+    
+    assert is_valid == True
+    assert count == len(expected), f"Should skip the malformed entry, got {count}"
+    
+    print("✓ test_score_filtering_many_detections passed")
+
+
+def test_vectorized_scores_match_loop(node):
+    """Test that unusual scores give the same result with and without vectorizing"""
+    for odd_score in ("0.9", True, 10 ** 400):
+        detections = [{"class": "A", "score": odd_score}, {"class": "B", "score": 0.9}]
+        padding = [{"class": "C", "score": 0.1}] * 100
+        
+        small = node.query_detections(detections, min_score=0.5)
+        large = node.query_detections(detections + padding, min_score=0.5)
+        
+        assert large[5] == small[5], f"Validity should not depend on length for {odd_score!r}"
+        assert large[2] == small[2], f"Matches should not depend on length for {odd_score!r}"
     
-    input_json = json.dumps(SAMPLE_DETECTIONS)
+    print("✓ test_vectorized_scores_match_loop passed")
+
+
+def test_non_numeric_score_other_class(node):
+    """Test that a null score on a filtered-out class does not fail the query"""
+    detections = [{"class": "A", "score": None}, {"class": "B", "score": 0.9}]
     
+    for padding in (0, 100):
+        input_json = json.dumps(detections + [{"class": "C", "score": 0.5}] * padding)
+        _, count, detection_list, _, _, is_valid, error = node.query_detections(
+            input_json,
+            class_filter="B",
+            min_score=0.5
+        )
+        
+        assert is_valid == True, f"Should be valid, got error: {error}"
+        assert count == 1, f"Should find the B detection, found {count}"
+        assert detection_list[0]["class"] == "B"
+    
+    print("✓ test_non_numeric_score_other_class passed")
+
+
+def test_combined_filters(node, sample_json):
+    """Test combining class and score filters"""
     # CLASS2_* with score > 0.77
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="CLASS2_*",
         min_score=0.77
     )
@@ -156,15 +289,11 @@ def test_combined_filters():
     print("✓ test_combined_filters passed")
 
 
-def test_max_results():
+def test_max_results(node, sample_json):
     """Test limiting number of results"""
-    node = DetectionQuery()
-    
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-    
     # Get only first 2 results
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="*",
         max_results=2
     )
@@ -175,15 +304,11 @@ def test_max_results():
     print("✓ test_max_results passed")
 
 
-def test_no_matches():
+def test_no_matches(node, sample_json):
     """Test when no detections match filters"""
-    node = DetectionQuery()
-    
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-    
     # Non-existent class
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="NONEXISTENT_CLASS"
     )
     
@@ -194,13 +319,10 @@ def test_no_matches():
     print("✓ test_no_matches passed")
 
 
-def test_json_output_format():
+def test_json_output_format(node, sample_json):
     """Test that JSON output is properly formatted"""
-    node = DetectionQuery()
-    
-    input_json = json.dumps(SAMPLE_DETECTIONS)
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="CLASS1_LABEL"
     )
     
@@ -215,13 +337,54 @@ def test_json_output_format():
     print("✓ test_json_output_format passed")
 
 
-def test_detection_list_output():
-    """Test that detection_list is proper list for OUTPUT_IS_LIST"""
-    node = DetectionQuery()
+def test_json_output_matches_stdlib(node):
+    """Test that filtered_json is byte-for-byte json.dumps(..., indent=2)"""
+    detections = [{"class": "Ä_LABEL", "score": 0.838, "box": [246, 149, 174, 207]}]
+    
+    filtered_json, count, _, _, _, is_valid, error = node.query_detections(json.dumps(detections))
+    
+    assert is_valid == True, f"Should be valid, got error: {error}"
+    assert filtered_json == json.dumps(detections, indent=2), \
+        f"Output should match json.dumps, got {filtered_json}"
+    assert "\\u00c4" in filtered_json, "Non-ASCII should be escaped like json.dumps"
+    
+    print("✓ test_json_output_matches_stdlib passed")
+
+
+def test_nan_and_infinity_scores(node):
+    """Test that NaN/Infinity scores parse like json.loads"""
+    input_json = '[{"class": "A", "score": NaN}, {"class": "B", "score": Infinity}]'
     
-    input_json = json.dumps(SAMPLE_DETECTIONS)
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
         input_json,
+        min_score=0.5
+    )
+    
+    assert is_valid == True, f"Should be valid, got error: {error}"
+    assert [d["class"] for d in detection_list] == ["A", "B"], \
+        "NaN and Infinity are not below the threshold, so both are kept"
+    assert "NaN" in filtered_json and "Infinity" in filtered_json
+    
+    print("✓ test_nan_and_infinity_scores passed")
+
+
+def test_parsed_input_non_str_keys(node):
+    """Test that parsed detections with non-string keys still serialize"""
+    detections = [{"class": "A", "score": 0.9, 1: "extra"}]
+    
+    filtered_json, count, _, _, _, is_valid, error = node.query_detections(detections)
+    
+    assert is_valid == True, f"Should be valid, got error: {error}"
+    assert count == 1
+    assert filtered_json == json.dumps(detections, indent=2)
+    
+    print("✓ test_parsed_input_non_str_keys passed")
+
+
+def test_detection_list_output(node, sample_json):
+    """Test that detection_list is proper list for OUTPUT_IS_LIST"""
+    filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
+        sample_json,
         class_filter="CLASS2_*"
     )
     
@@ -239,10 +402,8 @@ def test_detection_list_output():
     print("✓ test_detection_list_output passed")
 
 
-def test_invalid_json():
+def test_invalid_json(node):
     """Test handling of invalid JSON"""
-    node = DetectionQuery()
-    
     invalid_json = '{"broken": invalid}'
     filtered_json, count, detection_list, _, _, is_valid, error = node.query_detections(
         invalid_json,
@@ -256,10 +417,8 @@ def test_invalid_json():
     print("✓ test_invalid_json passed")
 
 
-def test_simple_list_format():
+def test_simple_list_format(node):
     """Test with simple list format (no wrapper)"""
-    node = DetectionQuery()
-    
     # Simple list without wrapper
     simple_data = [
         {"class": "CLASS1", "score": 0.9, "box": [1, 2, 3, 4]},
@@ -279,10 +438,8 @@ def test_simple_list_format():
     print("✓ test_simple_list_format passed")
 
 
-def test_categorization_extraction():
+def test_categorization_extraction(node):
     """Test extracting categorization field"""
-    node = DetectionQuery()
-    
     # Data with is_dog field
     test_data = [{
         "detect_result": [
@@ -315,13 +472,10 @@ def test_categorization_extraction():
     print("✓ test_categorization_extraction passed")
 
 
-def test_categorization_field_not_found():
+def test_categorization_field_not_found(node, sample_json):
     """Test when categorization field doesn't exist"""
-    node = DetectionQuery()
-    
-    input_json = json.dumps(SAMPLE_DETECTIONS)
     _, _, _, _, cat_value, is_valid, _ = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="*",
         categorization_field="nonexistent_field"
     )
@@ -332,10 +486,8 @@ def test_categorization_field_not_found():
     print("✓ test_categorization_field_not_found passed")
 
 
-def test_categorization_with_different_types():
+def test_categorization_with_different_types(node):
     """Test categorization field with different value types"""
-    node = DetectionQuery()
-    
     # String value
     test_data = [{
         "detect_result": [{"class": "A", "score": 0.9, "box": [1, 2, 3, 4]}],
@@ -358,15 +510,11 @@ def test_categorization_with_different_types():
     print("✓ test_categorization_with_different_types passed")
 
 
-def test_bbox_list_output():
+def test_bbox_list_output(node, sample_json):
     """Test bbox_list output (4th return value)"""
-    node = DetectionQuery()
-
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-
     # Get all detections
     filtered_json, count, detection_list, bbox_list, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="*"
     )
 
@@ -384,40 +532,31 @@ def test_bbox_list_output():
     print("✓ test_bbox_list_output passed")
 
 
-def test_bbox_list_with_filtering():
+def test_bbox_list_with_filtering(node, sample_json):
     """Test bbox_list only returns bboxes from filtered detections"""
-    node = DetectionQuery()
-
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-
     # Filter to only CLASS1_* detections
     filtered_json, count, detection_list, bbox_list, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="CLASS1_*"
     )
 
     assert count == 3, "Should filter to 3 CLASS1_* detections"
     assert len(bbox_list) == 3, f"bbox_list should have 3 items, got {len(bbox_list)}"
 
-    # Verify bbox_list matches detection_list
-    for i, detection in enumerate(detection_list):
-        expected_bbox = detection.get("box") or detection.get("bbox")
-        actual_bbox = bbox_list[i][0]  # Unwrap from [[...]]
-        assert actual_bbox == expected_bbox, \
-            f"bbox_list[{i}] should match detection_list[{i}] bbox"
+    # Verify bbox_list matches detection_list (unwrapping each [[...]])
+    expected_bboxes = [detection.get("box") or detection.get("bbox") for detection in detection_list]
+    actual_bboxes = [bbox[0] for bbox in bbox_list]
+    assert actual_bboxes == expected_bboxes, \
+        f"bbox_list should match detection_list bboxes, got {actual_bboxes}"
 
     print("✓ test_bbox_list_with_filtering passed")
 
 
-def test_bbox_list_with_score_filter():
+def test_bbox_list_with_score_filter(node, sample_json):
     """Test bbox_list respects score filtering"""
-    node = DetectionQuery()
-
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-
     # Only high confidence detections
     filtered_json, count, detection_list, bbox_list, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="*",
         min_score=0.7
     )
@@ -431,15 +570,11 @@ def test_bbox_list_with_score_filter():
     print("✓ test_bbox_list_with_score_filter passed")
 
 
-def test_bbox_list_with_max_results():
+def test_bbox_list_with_max_results(node, sample_json):
     """Test bbox_list respects max_results limit"""
-    node = DetectionQuery()
-
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-
     # Limit to 2 results
     filtered_json, count, detection_list, bbox_list, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="*",
         max_results=2
     )
@@ -450,15 +585,11 @@ def test_bbox_list_with_max_results():
     print("✓ test_bbox_list_with_max_results passed")
 
 
-def test_bbox_list_empty_when_no_matches():
+def test_bbox_list_empty_when_no_matches(node, sample_json):
     """Test bbox_list is empty when no detections match"""
-    node = DetectionQuery()
-
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-
     # Non-existent class
     filtered_json, count, detection_list, bbox_list, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="NONEXISTENT_CLASS"
     )
 
@@ -469,10 +600,8 @@ def test_bbox_list_empty_when_no_matches():
     print("✓ test_bbox_list_empty_when_no_matches passed")
 
 
-def test_bbox_list_handles_missing_bbox():
+def test_bbox_list_handles_missing_bbox(node):
     """Test bbox_list handles detections without box/bbox field"""
-    node = DetectionQuery()
-
     # Detection without bbox field
     detections_no_bbox = [{
         "detect_result": [
@@ -501,14 +630,10 @@ def test_bbox_list_handles_missing_bbox():
     print("✓ test_bbox_list_handles_missing_bbox passed")
 
 
-def test_bbox_list_format_compatibility():
+def test_bbox_list_format_compatibility(node, sample_json):
     """Test bbox_list format is compatible with BBoxesToMask node"""
-    node = DetectionQuery()
-
-    input_json = json.dumps(SAMPLE_DETECTIONS)
-
     filtered_json, count, detection_list, bbox_list, _, is_valid, error = node.query_detections(
-        input_json,
+        sample_json,
         class_filter="CLASS2_*"
     )
 
@@ -530,11 +655,9 @@ def test_bbox_list_format_compatibility():
     print("✓ test_bbox_list_format_compatibility passed")
 
 
-def test_return_types():
+def test_return_types(node, sample_json):
     """Validate return types"""
-    node = DetectionQuery()
-    
-    result = node.query_detections(json.dumps(SAMPLE_DETECTIONS), "*")
+    result = node.query_detections(sample_json, "*")
     
     assert isinstance(result, tuple)
     assert len(result) == 7, f"Should return 7 items, got {len(result)}"
@@ -559,9 +682,7 @@ def test_input_types_structure():
     if "optional" in input_types:
         all_inputs.update(input_types["optional"].keys())
     
-    function = getattr(DetectionQuery(), DetectionQuery.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = DetectionQuery._FUNCTION_PARAMS
     
     missing = function_params - all_inputs
     extra = all_inputs - function_params
@@ -573,54 +694,21 @@ def test_input_types_structure():
 
 
 def run_all_tests():
-    """Run all test functions"""
+    """Run all test functions through pytest so fixtures are honored"""
     print("Running tests for DetectionQuery...\n")
-    
-    try:
-        test_all_detections()
-        test_exact_class_match()
-        test_wildcard_prefix()
-        test_wildcard_suffix()
-        test_score_filtering()
-        test_combined_filters()
-        test_max_results()
-        test_no_matches()
-        test_json_output_format()
-        test_detection_list_output()
-        test_invalid_json()
-        test_simple_list_format()
-        test_categorization_extraction()
-        test_categorization_field_not_found()
-        test_categorization_with_different_types()
-        test_bbox_list_output()
-        test_bbox_list_with_filtering()
-        test_bbox_list_with_score_filter()
-        test_bbox_list_with_max_results()
-        test_bbox_list_empty_when_no_matches()
-        test_bbox_list_handles_missing_bbox()
-        test_bbox_list_format_compatibility()
-        test_return_types()
-        test_input_types_structure()
-        
-        print("\n" + "="*50)
+
+    exit_code = pytest.main([__file__, "-q", "-p", "no:cacheprovider"])
+
+    print("\n" + "="*50)
+    if exit_code == 0:
         print("✅ ALL TESTS PASSED!")
-        print("="*50)
-        return True
-        
-    except AssertionError as e:
-        print("\n" + "="*50)
-        print(f"❌ TEST FAILED: {e}")
-        print("="*50)
-        return False
-    except Exception as e:
-        print("\n" + "="*50)
-        print(f"❌ UNEXPECTED ERROR: {e}")
-        print("="*50)
-        import traceback
-        traceback.print_exc()
-        return False
+    else:
+        print(f"❌ TESTS FAILED (pytest exit code {int(exit_code)})")
+    print("="*50)
+
+    return exit_code == 0
 
 
 if __name__ == "__main__":
     success = run_all_tests()
-    exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -2,31 +2,25 @@
 Tests for Detection to BBox Node
 
 Run from project root:
-    python tests/test_detection_to_bbox.py
+    python -m tests.test_detection_to_bbox
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import json
-import inspect
 from detection_to_bbox import DetectionToBBox
 
+# Shared node instance - the node is stateless, so tests reuse one
+NODE = DetectionToBBox()
+
 
 def test_basic_extraction():
     """Test basic bbox extraction"""
-    node = DetectionToBBox()
-    
     detection = {
         "class": "DOG",
         "score": 0.95,
         "box": [100, 200, 50, 75]
     }
     
-    bbox, x, y, w, h, class_name, score = node.extract_bbox(json.dumps(detection))
+    bbox, x, y, w, h, class_name, score = NODE.extract_bbox(json.dumps(detection))
     
     # bbox is now a tensor
     assert isinstance(bbox, list), f"Expected list, got {type(bbox)}"
@@ -45,26 +39,24 @@ def test_basic_extraction():
 
 def test_bbox_key_variations():
     """Test different bbox key names"""
-    node = DetectionToBBox()
-    
     # Using "box"
     detection = {"box": [10, 20, 30, 40], "class": "CAT", "score": 0.8}
-    bbox, x, y, w, h, _, _ = node.extract_bbox(json.dumps(detection), bbox_key="box")
+    bbox, x, y, w, h, _, _ = NODE.extract_bbox(json.dumps(detection), bbox_key="box")
     assert bbox == [[10, 20, 30, 40]]
     
     # Using "bbox"
     detection = {"bbox": [15, 25, 35, 45], "class": "CAT", "score": 0.8}
-    bbox, x, y, w, h, _, _ = node.extract_bbox(json.dumps(detection), bbox_key="bbox")
+    bbox, x, y, w, h, _, _ = NODE.extract_bbox(json.dumps(detection), bbox_key="bbox")
     assert bbox == [[15, 25, 35, 45]]
     
     # Auto-detect "box"
     detection = {"box": [5, 6, 7, 8], "class": "BIRD", "score": 0.7}
-    bbox, _, _, _, _, _, _ = node.extract_bbox(json.dumps(detection))
+    bbox, _, _, _, _, _, _ = NODE.extract_bbox(json.dumps(detection))
     assert bbox == [[5, 6, 7, 8]]
     
     # Auto-detect "bbox"
     detection = {"bbox": [1, 2, 3, 4], "class": "FISH", "score": 0.6}
-    bbox, _, _, _, _, _, _ = node.extract_bbox(json.dumps(detection))
+    bbox, _, _, _, _, _, _ = NODE.extract_bbox(json.dumps(detection))
     assert bbox == [[1, 2, 3, 4]]
     
     print("✓ test_bbox_key_variations passed")
@@ -72,8 +64,6 @@ def test_bbox_key_variations():
 
 def test_from_detection_query():
     """Test with actual Detection Query output format"""
-    node = DetectionToBBox()
-    
     # This is what Detection Query outputs in detection_list
     detection = {
         "class": "CLASS1_LABEL",
@@ -81,7 +71,7 @@ def test_from_detection_query():
         "box": [246, 149, 174, 207]
     }
     
-    bbox, x, y, w, h, class_name, score = node.extract_bbox(json.dumps(detection))
+    bbox, x, y, w, h, class_name, score = NODE.extract_bbox(json.dumps(detection))
     
     assert bbox == [[246, 149, 174, 207]]
     assert x == 246
@@ -96,8 +86,6 @@ def test_from_detection_query():
 
 def test_integer_conversion():
     """Test that bbox values are converted to integers"""
-    node = DetectionToBBox()
-    
     # Float values in bbox
     detection = {
         "box": [10.7, 20.3, 30.9, 40.1],
@@ -105,7 +93,7 @@ def test_integer_conversion():
         "score": 0.5
     }
     
-    bbox, x, y, w, h, _, _ = node.extract_bbox(json.dumps(detection))
+    bbox, x, y, w, h, _, _ = NODE.extract_bbox(json.dumps(detection))
     
     # Check types
     assert isinstance(x, int), f"x should be int, got {type(x)}"
@@ -124,12 +112,10 @@ def test_integer_conversion():
 
 def test_missing_bbox():
     """Test handling when bbox is missing"""
-    node = DetectionToBBox()
-    
     # No bbox at all
     detection = {"class": "NO_BOX", "score": 0.5}
     
-    bbox, x, y, w, h, class_name, score = node.extract_bbox(json.dumps(detection))
+    bbox, x, y, w, h, class_name, score = NODE.extract_bbox(json.dumps(detection))
     
     assert bbox == [[0, 0, 0, 0]], "Should return zeros for missing bbox"
     assert x == 0 and y == 0 and w == 0 and h == 0
@@ -140,29 +126,31 @@ def test_missing_bbox():
 
 def test_invalid_bbox_length():
     """Test handling of malformed bbox"""
-    node = DetectionToBBox()
-    
     # Too few values
     detection = {"box": [10, 20], "class": "BAD", "score": 0.5}
-    bbox, _, _, _, _, _, _ = node.extract_bbox(json.dumps(detection))
+    bbox, _, _, _, _, _, _ = NODE.extract_bbox(json.dumps(detection))
     assert bbox == [[0, 0, 0, 0]], "Should return zeros for invalid bbox"
     
     # Too many values
     detection = {"box": [10, 20, 30, 40, 50], "class": "BAD", "score": 0.5}
-    bbox, _, _, _, _, _, _ = node.extract_bbox(json.dumps(detection))
+    bbox, _, _, _, _, _, _ = NODE.extract_bbox(json.dumps(detection))
     assert bbox == [[0, 0, 0, 0]], "Should return zeros for invalid bbox"
     
+    # Non-numeric values
+    detection = {"box": [10, "left", 30, 40], "class": "BAD", "score": 0.5}
+    bbox, _, _, _, _, class_name, score = NODE.extract_bbox(json.dumps(detection))
+    assert bbox == [[0, 0, 0, 0]], "Should return zeros for non-numeric bbox"
+    assert class_name == "BAD" and score == 0.5, "Should still extract class/score"
+    
     print("✓ test_invalid_bbox_length passed")
 
 
 def test_missing_optional_fields():
     """Test when class or score are missing"""
-    node = DetectionToBBox()
-    
     # No class or score
     detection = {"box": [10, 20, 30, 40]}
     
-    bbox, x, y, w, h, class_name, score = node.extract_bbox(json.dumps(detection))
+    bbox, x, y, w, h, class_name, score = NODE.extract_bbox(json.dumps(detection))
     
     assert bbox == [[10, 20, 30, 40]], "Should still extract bbox"
     assert class_name == "", "Missing class should return empty string"
@@ -171,12 +159,23 @@ def test_missing_optional_fields():
     print("✓ test_missing_optional_fields passed")
 
 
+def test_nan_score():
+    """Test that NaN scores parse like json.loads"""
+    detection = '{"class": "A", "score": NaN, "box": [10, 20, 30, 40]}'
+    
+    bbox, x, y, w, h, class_name, score = NODE.extract_bbox(detection)
+    
+    assert bbox == [[10, 20, 30, 40]], f"Should still extract bbox, got {bbox}"
+    assert class_name == "A", f"Should keep class, got {class_name}"
+    assert score != score, f"Score should be NaN, got {score}"
+    
+    print("✓ test_nan_score passed")
+
+
 def test_return_types():
     """Validate return types"""
-    node = DetectionToBBox()
-    
     detection = {"box": [10, 20, 30, 40], "class": "TEST", "score": 0.9}
-    result = node.extract_bbox(json.dumps(detection))
+    result = NODE.extract_bbox(json.dumps(detection))
     
     assert isinstance(result, tuple), "Should return tuple"
     assert len(result) == 7, f"Should return 7 items, got {len(result)}"
@@ -204,9 +203,7 @@ def test_input_types_structure():
     if "optional" in input_types:
         all_inputs.update(input_types["optional"].keys())
     
-    function = getattr(DetectionToBBox(), DetectionToBBox.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = DetectionToBBox._FUNCTION_PARAMS
     
     missing = function_params - all_inputs
     extra = all_inputs - function_params
@@ -229,6 +226,7 @@ def run_all_tests():
         test_missing_bbox()
         test_invalid_bbox_length()
         test_missing_optional_fields()
+        test_nan_score()
         test_return_types()
         test_input_types_structure()
         
@@ -1,16 +1,11 @@
 """
 Tests for JSON Pretty Printer Node
 
-Run with: python test_json_pretty_printer.py
+Run from project root:
+    python -m tests.test_json_pretty_printer
 """
 
 import json
-import inspect
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from json_pretty_printer import JSONPrettyPrinter
 
@@ -138,29 +133,17 @@ def test_various_json_types():
     """Test with different JSON structures"""
     node = JSONPrettyPrinter()
     
-    # Array
-    array_json = '[1,2,3,4,5]'
-    formatted, is_valid, _ = node.format_json(array_json)
-    assert is_valid == True
-    
-    # Nested object
-    nested_json = '{"a":{"b":{"c":{"d":1}}}}'
-    formatted, is_valid, _ = node.format_json(nested_json)
-    assert is_valid == True
-    
-    # Mixed
-    mixed_json = '{"items":[{"id":1},{"id":2}],"count":2}'
-    formatted, is_valid, _ = node.format_json(mixed_json)
-    assert is_valid == True
-    
-    # Empty
-    empty_obj = '{}'
-    formatted, is_valid, _ = node.format_json(empty_obj)
-    assert is_valid == True
-    
-    empty_array = '[]'
-    formatted, is_valid, _ = node.format_json(empty_array)
-    assert is_valid == True
+    format_json = node.format_json
+    samples = (
+        '[1,2,3,4,5]',                               # Array
+        '{"a":{"b":{"c":{"d":1}}}}',                 # Nested object
+        '{"items":[{"id":1},{"id":2}],"count":2}',   # Mixed
+        '{}',                                        # Empty object
+        '[]',                                        # Empty array
+    )
+    for sample in samples:
+        _, is_valid, _ = format_json(sample)
+        assert is_valid == True, f"Should be valid: {sample}"
     
     print("✓ test_various_json_types passed")
 
@@ -204,9 +187,7 @@ def test_input_types_structure():
     if "optional" in input_types:
         all_inputs.update(input_types["optional"].keys())
     
-    function = getattr(JSONPrettyPrinter(), JSONPrettyPrinter.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = JSONPrettyPrinter._FUNCTION_PARAMS
     
     missing = function_params - all_inputs
     extra = all_inputs - function_params
@@ -2,26 +2,38 @@
 Tests for JSON to BBox Node
 
 Run from project root:
-    python tests/test_json_to_bbox.py
+    python -m tests.test_json_to_bbox
 """
 
 import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import json
-import inspect
+
+import numpy as np
+import pytest
 from json_to_bbox import JSONToBBox
 
+# Shared inputs, serialized once at import
+TWO_BBOXES_XYXY_JSON = json.dumps([[10, 20, 110, 120], [200, 300, 250, 400]])
+LARGE_BBOXES_JSON = json.dumps([[i*10, i*10, i*10+50, i*10+50] for i in range(100)])
 
-def test_xyxy_to_xywh():
-    """Test converting XYXY format to XYWH format"""
-    node = JSONToBBox()
+# Typical SAM3 boxes output (XYXY format)
+SAM3_JSON = json.dumps([
+    [245.3, 167.8, 512.6, 389.2],
+    [100.0, 200.0, 300.0, 400.0],
+    [450.5, 100.3, 600.7, 250.9]
+])
+
+
+@pytest.fixture(scope="module")
+def node():
+    """Single node instance shared by every test in this module"""
+    return JSONToBBox()
 
+
+def test_xyxy_to_xywh(node):
+    """Test converting XYXY format to XYWH format"""
     # Two bboxes in XYXY format
-    json_string = json.dumps([[10, 20, 110, 120], [200, 300, 250, 400]])
+    json_string = TWO_BBOXES_XYXY_JSON
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
 
@@ -33,19 +45,17 @@ def test_xyxy_to_xywh():
     assert isinstance(bbox1, list), "Each bbox should be wrapped in list"
     assert len(bbox1) == 1, "Each bbox should have one element (the coordinates)"
     coords1 = bbox1[0]
-    assert coords1 == [10.0, 20.0, 100.0, 100.0], f"Expected [10, 20, 100, 100], got {coords1}"
+    np.testing.assert_allclose(coords1, [10.0, 20.0, 100.0, 100.0], atol=1e-9, err_msg="Expected [10, 20, 100, 100]")
 
     # Second bbox: (200, 300, 250, 400) XYXY -> (200, 300, 50, 100) XYWH
     coords2 = bboxes[1][0]
-    assert coords2 == [200.0, 300.0, 50.0, 100.0], f"Expected [200, 300, 50, 100], got {coords2}"
+    np.testing.assert_allclose(coords2, [200.0, 300.0, 50.0, 100.0], atol=1e-9, err_msg="Expected [200, 300, 50, 100]")
 
     print("✓ test_xyxy_to_xywh passed")
 
 
-def test_xywh_to_xyxy():
+def test_xywh_to_xyxy(node):
     """Test converting XYWH format to XYXY format"""
-    node = JSONToBBox()
-
     # Two bboxes in XYWH format
     json_string = json.dumps([[10, 20, 100, 100], [200, 300, 50, 100]])
 
@@ -55,49 +65,64 @@ def test_xywh_to_xyxy():
 
     # First bbox: (10, 20, 100, 100) XYWH -> (10, 20, 110, 120) XYXY
     coords1 = bboxes[0][0]
-    assert coords1 == [10.0, 20.0, 110.0, 120.0], f"Expected [10, 20, 110, 120], got {coords1}"
+    np.testing.assert_allclose(coords1, [10.0, 20.0, 110.0, 120.0], atol=1e-9, err_msg="Expected [10, 20, 110, 120]")
 
     # Second bbox: (200, 300, 50, 100) XYWH -> (200, 300, 250, 400) XYXY
     coords2 = bboxes[1][0]
-    assert coords2 == [200.0, 300.0, 250.0, 400.0], f"Expected [200, 300, 250, 400], got {coords2}"
+    np.testing.assert_allclose(coords2, [200.0, 300.0, 250.0, 400.0], atol=1e-9, err_msg="Expected [200, 300, 250, 400]")
 
     print("✓ test_xywh_to_xyxy passed")
 
 
-def test_no_conversion_xyxy():
+def test_no_conversion_xyxy(node):
     """Test XYXY to XYXY (no conversion)"""
-    node = JSONToBBox()
-
     json_string = json.dumps([[10, 20, 110, 120]])
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYXY")
 
     assert count == 1, "Should have 1 bbox"
     coords = bboxes[0][0]
-    assert coords == [10.0, 20.0, 110.0, 120.0], f"Coordinates should be unchanged, got {coords}"
+    np.testing.assert_allclose(coords, [10.0, 20.0, 110.0, 120.0], atol=1e-9, err_msg="Coordinates should be unchanged")
 
     print("✓ test_no_conversion_xyxy passed")
 
 
-def test_no_conversion_xywh():
+def test_no_conversion_xywh(node):
     """Test XYWH to XYWH (no conversion)"""
-    node = JSONToBBox()
-
     json_string = json.dumps([[10, 20, 100, 100]])
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYWH", output_format="XYWH")
 
     assert count == 1, "Should have 1 bbox"
     coords = bboxes[0][0]
-    assert coords == [10.0, 20.0, 100.0, 100.0], f"Coordinates should be unchanged, got {coords}"
+    np.testing.assert_allclose(coords, [10.0, 20.0, 100.0, 100.0], atol=1e-9, err_msg="Coordinates should be unchanged")
 
     print("✓ test_no_conversion_xywh passed")
 
 
-def test_empty_array():
-    """Test handling of empty JSON array"""
-    node = JSONToBBox()
+def test_bytes_input(node):
+    """Test that bytes input gives the same result as str input"""
+    from_str = node.json_to_bbox(TWO_BBOXES_XYXY_JSON, input_format="XYXY", output_format="XYWH")
+    from_bytes = node.json_to_bbox(TWO_BBOXES_XYXY_JSON.encode("utf-8"),
+                                   input_format="XYXY", output_format="XYWH")
+
+    assert from_bytes == from_str, f"Bytes input should match str input, got {from_bytes}"
+
+    print("✓ test_bytes_input passed")
+
+
+def test_infinity_coordinates(node):
+    """Test that Infinity parses like json.loads"""
+    bboxes, count = node.json_to_bbox("[[0, 0, Infinity, 10]]", input_format="XYXY", output_format="XYXY")
 
+    assert count == 1, f"Should parse Infinity like json.loads, got {count}"
+    np.testing.assert_allclose(bboxes[0][0], [0.0, 0.0, float("inf"), 10.0])
+
+    print("✓ test_infinity_coordinates passed")
+
+
+def test_empty_array(node):
+    """Test handling of empty JSON array"""
     json_string = "[]"
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
@@ -108,10 +133,8 @@ def test_empty_array():
     print("✓ test_empty_array passed")
 
 
-def test_invalid_json():
+def test_invalid_json(node):
     """Test handling of invalid JSON"""
-    node = JSONToBBox()
-
     json_string = "not valid json {["
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
@@ -122,10 +145,8 @@ def test_invalid_json():
     print("✓ test_invalid_json passed")
 
 
-def test_non_array_json():
+def test_non_array_json(node):
     """Test handling of JSON that's not an array"""
-    node = JSONToBBox()
-
     # JSON object instead of array
     json_string = json.dumps({"bbox": [10, 20, 110, 120]})
 
@@ -137,10 +158,8 @@ def test_non_array_json():
     print("✓ test_non_array_json passed")
 
 
-def test_invalid_bbox_formats():
+def test_invalid_bbox_formats(node):
     """Test handling of invalid bbox formats in the array"""
-    node = JSONToBBox()
-
     # Mix of valid and invalid bboxes
     json_string = json.dumps([
         [10, 20, 110, 120],      # Valid
@@ -157,18 +176,34 @@ def test_invalid_bbox_formats():
 
     # Check that only valid bboxes were processed
     coords1 = bboxes[0][0]
-    assert coords1 == [10.0, 20.0, 100.0, 100.0], "First valid bbox"
+    np.testing.assert_allclose(coords1, [10.0, 20.0, 100.0, 100.0], atol=1e-9, err_msg="First valid bbox")
 
     coords2 = bboxes[1][0]
-    assert coords2 == [100.0, 200.0, 50.0, 50.0], "Second valid bbox"
+    np.testing.assert_allclose(coords2, [100.0, 200.0, 50.0, 50.0], atol=1e-9, err_msg="Second valid bbox")
 
     print("✓ test_invalid_bbox_formats passed")
 
 
-def test_negative_coordinates():
-    """Test handling of negative coordinates (valid in some contexts)"""
-    node = JSONToBBox()
+def test_non_numeric_coordinates(node):
+    """Test that a null or non-numeric coordinate fails the whole input"""
+    for bad_row in ([None, 2, 3, 4], ["a", 2, 3, 4]):
+        json_string = json.dumps([[1, 2, 3, 4], bad_row])
+
+        bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
+
+        assert (bboxes, count) == ([], 0), f"{bad_row} should fail the whole input, got {bboxes}"
 
+    # NaN is a number, so it is passed through like any other coordinate
+    bboxes, count = node.json_to_bbox("[[1, 2, 3, 4], [NaN, 2, 3, 4]]", input_format="XYXY", output_format="XYXY")
+
+    assert count == 2, f"NaN coordinates should be kept, got {count}"
+    np.testing.assert_allclose(bboxes[1][0], [float("nan"), 2.0, 3.0, 4.0])
+
+    print("✓ test_non_numeric_coordinates passed")
+
+
+def test_negative_coordinates(node):
+    """Test handling of negative coordinates (valid in some contexts)"""
     # Bbox with negative coordinates
     json_string = json.dumps([[-10, -20, 50, 60]])
 
@@ -177,15 +212,13 @@ def test_negative_coordinates():
     assert count == 1, "Should handle negative coordinates"
     coords = bboxes[0][0]
     # (-10, -20, 50, 60) XYXY -> (-10, -20, 60, 80) XYWH
-    assert coords == [-10.0, -20.0, 60.0, 80.0], f"Should handle negative coords, got {coords}"
+    np.testing.assert_allclose(coords, [-10.0, -20.0, 60.0, 80.0], atol=1e-9, err_msg="Should handle negative coords")
 
     print("✓ test_negative_coordinates passed")
 
 
-def test_zero_size_bbox():
+def test_zero_size_bbox(node):
     """Test handling of zero-width or zero-height bbox"""
-    node = JSONToBBox()
-
     # Zero-width bbox in XYXY: x1 == x2
     json_string = json.dumps([[100, 100, 100, 200]])
 
@@ -194,15 +227,13 @@ def test_zero_size_bbox():
     assert count == 1, "Should process zero-width bbox"
     coords = bboxes[0][0]
     # (100, 100, 100, 200) XYXY -> (100, 100, 0, 100) XYWH
-    assert coords == [100.0, 100.0, 0.0, 100.0], f"Should handle zero width, got {coords}"
+    np.testing.assert_allclose(coords, [100.0, 100.0, 0.0, 100.0], atol=1e-9, err_msg="Should handle zero width")
 
     print("✓ test_zero_size_bbox passed")
 
 
-def test_float_coordinates():
+def test_float_coordinates(node):
     """Test handling of floating point coordinates"""
-    node = JSONToBBox()
-
     json_string = json.dumps([[10.5, 20.7, 110.3, 120.9]])
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
@@ -210,22 +241,16 @@ def test_float_coordinates():
     assert count == 1, "Should handle float coordinates"
     coords = bboxes[0][0]
     # (10.5, 20.7, 110.3, 120.9) XYXY -> (10.5, 20.7, 99.8, 100.2) XYWH
-    expected = [10.5, 20.7, 99.8, 100.19999999999999]  # Floating point precision
-    assert coords[0] == expected[0], "X coordinate"
-    assert coords[1] == expected[1], "Y coordinate"
-    assert abs(coords[2] - 99.8) < 0.001, "Width should be approximately 99.8"
-    assert abs(coords[3] - 100.2) < 0.001, "Height should be approximately 100.2"
+    expected = [10.5, 20.7, 110.3 - 10.5, 120.9 - 20.7]
+    np.testing.assert_allclose(coords, expected, atol=1e-9, err_msg="Float coordinates")
 
     print("✓ test_float_coordinates passed")
 
 
-def test_large_number_of_bboxes():
+def test_large_number_of_bboxes(node):
     """Test handling many bboxes"""
-    node = JSONToBBox()
-
-    # Create 100 bboxes
-    bboxes_input = [[i*10, i*10, i*10+50, i*10+50] for i in range(100)]
-    json_string = json.dumps(bboxes_input)
+    # 100 bboxes
+    json_string = LARGE_BBOXES_JSON
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
 
@@ -233,17 +258,15 @@ def test_large_number_of_bboxes():
     assert len(bboxes) == 100, "Should return 100 bboxes"
 
     # Check first and last
-    assert bboxes[0][0] == [0.0, 0.0, 50.0, 50.0], "First bbox"
-    assert bboxes[99][0] == [990.0, 990.0, 50.0, 50.0], "Last bbox"
+    np.testing.assert_allclose(bboxes[0][0], [0.0, 0.0, 50.0, 50.0], atol=1e-9, err_msg="First bbox")
+    np.testing.assert_allclose(bboxes[99][0], [990.0, 990.0, 50.0, 50.0], atol=1e-9, err_msg="Last bbox")
 
     print("✓ test_large_number_of_bboxes passed")
 
 
-def test_output_format():
+def test_output_format(node):
     """Test that output format matches BBOX type requirements"""
-    node = JSONToBBox()
-
-    json_string = json.dumps([[10, 20, 110, 120], [200, 300, 250, 400]])
+    json_string = TWO_BBOXES_XYXY_JSON
 
     bboxes, count = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
 
@@ -262,10 +285,8 @@ def test_output_format():
     print("✓ test_output_format passed")
 
 
-def test_return_types():
+def test_return_types(node):
     """Validate return types match OUTPUT_IS_LIST specification"""
-    node = JSONToBBox()
-
     json_string = json.dumps([[10, 20, 110, 120]])
 
     result = node.json_to_bbox(json_string, input_format="XYXY", output_format="XYWH")
@@ -291,9 +312,7 @@ def test_input_types_structure():
     if "optional" in input_types:
         all_inputs.update(input_types["optional"].keys())
 
-    function = getattr(JSONToBBox(), JSONToBBox.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = JSONToBBox._FUNCTION_PARAMS
 
     missing = function_params - all_inputs
     extra = all_inputs - function_params
@@ -304,74 +323,36 @@ def test_input_types_structure():
     print("✓ test_input_types_structure passed")
 
 
-def test_sam3_format():
+def test_sam3_format(node):
     """Test typical SAM3 Segmentation output format"""
-    node = JSONToBBox()
-
-    # Typical SAM3 boxes output (XYXY format)
-    sam3_json = json.dumps([
-        [245.3, 167.8, 512.6, 389.2],
-        [100.0, 200.0, 300.0, 400.0],
-        [450.5, 100.3, 600.7, 250.9]
-    ])
-
-    bboxes, count = node.json_to_bbox(sam3_json, input_format="XYXY", output_format="XYWH")
+    bboxes, count = node.json_to_bbox(SAM3_JSON, input_format="XYXY", output_format="XYWH")
 
     assert count == 3, f"Should extract 3 bboxes from SAM3 output, got {count}"
 
     # Verify first bbox conversion
     coords = bboxes[0][0]
-    expected_w = 512.6 - 245.3
-    expected_h = 389.2 - 167.8
-    assert abs(coords[0] - 245.3) < 0.001, "X coordinate"
-    assert abs(coords[1] - 167.8) < 0.001, "Y coordinate"
-    assert abs(coords[2] - expected_w) < 0.001, "Width"
-    assert abs(coords[3] - expected_h) < 0.001, "Height"
+    expected = [245.3, 167.8, 512.6 - 245.3, 389.2 - 167.8]
+    np.testing.assert_allclose(coords, expected, atol=1e-9, err_msg="First SAM3 bbox")
 
     print("✓ test_sam3_format passed")
 
 
 def run_all_tests():
-    """Run all test functions"""
+    """Run all test functions through pytest so fixtures are honored"""
     print("Running tests for JSONToBBox...\n")
 
-    try:
-        test_xyxy_to_xywh()
-        test_xywh_to_xyxy()
-        test_no_conversion_xyxy()
-        test_no_conversion_xywh()
-        test_empty_array()
-        test_invalid_json()
-        test_non_array_json()
-        test_invalid_bbox_formats()
-        test_negative_coordinates()
-        test_zero_size_bbox()
-        test_float_coordinates()
-        test_large_number_of_bboxes()
-        test_output_format()
-        test_return_types()
-        test_input_types_structure()
-        test_sam3_format()
-
-        print("\n" + "="*50)
+    exit_code = pytest.main([__file__, "-q", "-p", "no:cacheprovider"])
+
+    print("\n" + "="*50)
+    if exit_code == 0:
         print("✅ ALL TESTS PASSED!")
-        print("="*50)
-        return True
-
-    except AssertionError as e:
-        print("\n" + "="*50)
-        print(f"❌ TEST FAILED: {e}")
-        print("="*50)
-        return False
-    except Exception as e:
-        print("\n" + "="*50)
-        print(f"❌ UNEXPECTED ERROR: {e}")
-        print("="*50)
-        import traceback
-        traceback.print_exc()
-        return False
+    else:
+        print(f"❌ TESTS FAILED (pytest exit code {int(exit_code)})")
+    print("="*50)
+
+    return exit_code == 0
 
 
 if __name__ == "__main__":
     success = run_all_tests()
-    exit(0 if success else 1)
+    sys.exit(0 if success else 1)
@@ -1,16 +1,10 @@
 """
 Tests for List Index Selector Node
 
-Run with: python test_list_index_selector.py
+Run from project root:
+    python -m tests.test_list_index_selector
 """
 
-import inspect
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from list_index_selector import ListIndexSelector
 
 
@@ -243,9 +237,7 @@ def test_input_types_structure():
     if "optional" in input_types:
         all_inputs.update(input_types["optional"].keys())
     
-    function = getattr(ListIndexSelector(), ListIndexSelector.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = ListIndexSelector._FUNCTION_PARAMS
     
     missing = function_params - all_inputs
     extra = all_inputs - function_params
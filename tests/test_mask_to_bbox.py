@@ -5,12 +5,8 @@ Test the conversion of masks to bounding boxes in XYWH format.
 """
 
 import sys
-from pathlib import Path
 import torch
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from mask_to_bbox import MaskToBBox
 
 
@@ -105,6 +101,20 @@ def test_float_mask_threshold():
     print("✓ test_float_mask_threshold passed")
 
 
+def test_bool_mask():
+    """Test that bool masks are used without re-thresholding"""
+    node = MaskToBBox()
+
+    mask = torch.zeros((100, 100), dtype=torch.bool)
+    mask[30:40, 20:50] = True
+
+    bbox, x, y, w, h = node.mask_to_bbox(mask)
+
+    assert bbox == [[20, 30, 30, 10]], f"Expected [[20, 30, 30, 10]], got {bbox}"
+
+    print("✓ test_bool_mask passed")
+
+
 def test_empty_mask():
     """Test handling of empty mask"""
     node = MaskToBBox()
@@ -123,6 +133,20 @@ def test_empty_mask():
     print("✓ test_empty_mask passed")
 
 
+def test_empty_results_not_shared():
+    """Test that modifying one empty result does not affect later calls"""
+    node = MaskToBBox()
+
+    for mask in [torch.zeros((4, 4)), "not a tensor"]:
+        bbox = node.mask_to_bbox(mask)[0]
+        bbox[0][0] = 99
+
+        bbox = node.mask_to_bbox(mask)[0]
+        assert bbox == [[0, 0, 0, 0]], f"Empty bbox was modified: {bbox}"
+
+    print("✓ test_empty_results_not_shared passed")
+
+
 def test_full_mask():
     """Test mask covering entire image"""
     node = MaskToBBox()
@@ -258,6 +282,10 @@ def test_input_types_signature():
     # Check no optional inputs
     assert "optional" not in input_types or len(input_types["optional"]) == 0
 
+    # Check inputs match the function parameters
+    assert set(input_types["required"]) == MaskToBBox._FUNCTION_PARAMS, \
+        f"INPUT_TYPES should match function params {set(MaskToBBox._FUNCTION_PARAMS)}"
+
     print("✓ test_input_types_signature passed")
 
 
@@ -272,7 +300,9 @@ def run_all_tests():
         test_single_pixel,
         test_irregular_shape,
         test_float_mask_threshold,
+        test_bool_mask,
         test_empty_mask,
+        test_empty_results_not_shared,
         test_full_mask,
         test_batched_mask,
         test_edge_cases_coordinates,
@@ -4,18 +4,15 @@ Tests for SEGs to Mask Node
 Tests the SEGS (segmentation) to mask converter with filtering and union features.
 
 Run from project root:
-    python tests/test_segs_to_mask.py
+    python -m tests.test_segs_to_mask
 """
 
 import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import inspect
 
 import torch
 import numpy as np
-import inspect
+import pytest
 from segs_to_mask import SEGsToMask
 
 
@@ -57,12 +54,22 @@ def create_mock_segs(height=512, width=512, seg_data=None):
     return ((height, width), seg_list)
 
 
-def test_basic_single_seg():
-    """Test converting single SEG to mask"""
-    node = SEGsToMask()
+@pytest.fixture(scope="module")
+def node():
+    """Single node instance shared by every test in this module"""
+    return SEGsToMask()
+
+
+@pytest.fixture(scope="module")
+def masks():
+    """Solid square masks by side length, built once and shared (read-only)"""
+    return {size: np.ones((size, size), dtype=np.float32) for size in (10, 20, 25, 30, 50, 100)}
+
 
+def test_basic_single_seg(node, masks):
+    """Test converting single SEG to mask"""
     # Create a simple 50x50 mask at position (10, 10)
-    mask = np.ones((50, 50), dtype=np.float32)
+    mask = masks[50]
     segs = create_mock_segs(512, 512, [
         (mask, [10, 10, 60, 60], "person_0", 0.95)
     ])
@@ -77,19 +84,17 @@ def test_basic_single_seg():
     assert count == 1, f"Count should be 1, got {count}"
 
     # Check mask content
-    assert combined[10:60, 10:60].sum() == 50 * 50, "Mask should fill crop region"
+    assert (combined[10:60, 10:60] == 1).all(), "Mask should fill crop region"
     assert labels[0] == "person_0: 0.95", f"Label should be 'person_0: 0.95', got {labels[0]}"
 
     print("✓ test_basic_single_seg passed")
 
 
-def test_union_same_labels():
+def test_union_same_labels(node, masks):
     """Test union of segments with same label"""
-    node = SEGsToMask()
-
     # Create two masks for same label at different positions
-    mask1 = np.ones((30, 30), dtype=np.float32)
-    mask2 = np.ones((20, 20), dtype=np.float32)
+    mask1 = masks[30]
+    mask2 = masks[20]
 
     segs = create_mock_segs(512, 512, [
         (mask1, [10, 10, 40, 40], "person_0", 0.95),
@@ -105,8 +110,8 @@ def test_union_same_labels():
 
     # Check that both regions are filled in the unified mask
     unified_mask = individual[0]
-    assert unified_mask[10:40, 10:40].sum() == 30 * 30, "First region should be filled"
-    assert unified_mask[100:120, 100:120].sum() == 20 * 20, "Second region should be filled"
+    assert (unified_mask[10:40, 10:40] == 1).all(), "First region should be filled"
+    assert (unified_mask[100:120, 100:120] == 1).all(), "Second region should be filled"
 
     # Should use max confidence (0.95)
     assert labels[0] == "person_0: 0.95", f"Should use max confidence, got {labels[0]}"
@@ -114,12 +119,10 @@ def test_union_same_labels():
     print("✓ test_union_same_labels passed")
 
 
-def test_no_union_separate_masks():
+def test_no_union_separate_masks(node, masks):
     """Test without union - each segment gets own mask"""
-    node = SEGsToMask()
-
-    mask1 = np.ones((30, 30), dtype=np.float32)
-    mask2 = np.ones((20, 20), dtype=np.float32)
+    mask1 = masks[30]
+    mask2 = masks[20]
 
     segs = create_mock_segs(512, 512, [
         (mask1, [10, 10, 40, 40], "person_0", 0.95),
@@ -136,21 +139,19 @@ def test_no_union_separate_masks():
     # Each mask should only have one region
     mask1 = individual[0]
     mask2 = individual[1]
-    assert mask1[10:40, 10:40].sum() == 30 * 30, "First mask should have first region"
-    assert mask1[100:120, 100:120].sum() == 0, "First mask should not have second region"
-    assert mask2[100:120, 100:120].sum() == 20 * 20, "Second mask should have second region"
-    assert mask2[10:40, 10:40].sum() == 0, "Second mask should not have first region"
+    assert (mask1[10:40, 10:40] == 1).all(), "First mask should have first region"
+    assert not mask1[100:120, 100:120].any(), "First mask should not have second region"
+    assert (mask2[100:120, 100:120] == 1).all(), "Second mask should have second region"
+    assert not mask2[10:40, 10:40].any(), "Second mask should not have first region"
 
     print("✓ test_no_union_separate_masks passed")
 
 
-def test_multiple_labels():
+def test_multiple_labels(node, masks):
     """Test with multiple different labels"""
-    node = SEGsToMask()
-
-    mask1 = np.ones((30, 30), dtype=np.float32)
-    mask2 = np.ones((20, 20), dtype=np.float32)
-    mask3 = np.ones((25, 25), dtype=np.float32)
+    mask1 = masks[30]
+    mask2 = masks[20]
+    mask3 = masks[25]
 
     segs = create_mock_segs(512, 512, [
         (mask1, [10, 10, 40, 40], "person_0", 0.95),
@@ -167,13 +168,11 @@ def test_multiple_labels():
     print("✓ test_multiple_labels passed")
 
 
-def test_label_filter_wildcard():
+def test_label_filter_wildcard(node, masks):
     """Test label filtering with wildcards"""
-    node = SEGsToMask()
-
-    mask1 = np.ones((30, 30), dtype=np.float32)
-    mask2 = np.ones((20, 20), dtype=np.float32)
-    mask3 = np.ones((25, 25), dtype=np.float32)
+    mask1 = masks[30]
+    mask2 = masks[20]
+    mask3 = masks[25]
 
     segs = create_mock_segs(512, 512, [
         (mask1, [10, 10, 40, 40], "person_0", 0.95),
@@ -191,13 +190,11 @@ def test_label_filter_wildcard():
     print("✓ test_label_filter_wildcard passed")
 
 
-def test_confidence_filter():
+def test_confidence_filter(node, masks):
     """Test filtering by minimum confidence"""
-    node = SEGsToMask()
-
-    mask1 = np.ones((30, 30), dtype=np.float32)
-    mask2 = np.ones((20, 20), dtype=np.float32)
-    mask3 = np.ones((25, 25), dtype=np.float32)
+    mask1 = masks[30]
+    mask2 = masks[20]
+    mask3 = masks[25]
 
     segs = create_mock_segs(512, 512, [
         (mask1, [10, 10, 40, 40], "person_0", 0.95),
@@ -215,13 +212,11 @@ def test_confidence_filter():
     print("✓ test_confidence_filter passed")
 
 
-def test_min_area_filter():
+def test_min_area_filter(node, masks):
     """Test filtering by minimum area percentage"""
-    node = SEGsToMask()
-
     # Create masks of different sizes
-    large_mask = np.ones((100, 100), dtype=np.float32)  # 10000 pixels
-    small_mask = np.ones((10, 10), dtype=np.float32)    # 100 pixels
+    large_mask = masks[100]  # 10000 pixels
+    small_mask = masks[10]   # 100 pixels
 
     # At 512x512 = 262144 pixels:
     # - 10000 pixels = 3.8%
@@ -242,11 +237,9 @@ def test_min_area_filter():
     print("✓ test_min_area_filter passed")
 
 
-def test_sort_order_x_then_y():
+def test_sort_order_x_then_y(node, masks):
     """Test sorting by x coordinate then y"""
-    node = SEGsToMask()
-
-    mask = np.ones((20, 20), dtype=np.float32)
+    mask = masks[20]
 
     segs = create_mock_segs(512, 512, [
         (mask, [100, 10, 120, 30], "seg_0", 0.95),   # x=100, y=10
@@ -266,11 +259,9 @@ def test_sort_order_x_then_y():
     print("✓ test_sort_order_x_then_y passed")
 
 
-def test_sort_order_confidence():
+def test_sort_order_confidence(node, masks):
     """Test sorting by confidence (high to low)"""
-    node = SEGsToMask()
-
-    mask = np.ones((20, 20), dtype=np.float32)
+    mask = masks[20]
 
     segs = create_mock_segs(512, 512, [
         (mask, [10, 10, 30, 30], "seg_0", 0.75),
@@ -290,11 +281,9 @@ def test_sort_order_confidence():
     print("✓ test_sort_order_confidence passed")
 
 
-def test_sort_order_y_then_x():
+def test_sort_order_y_then_x(node, masks):
     """Test sorting by y coordinate then x"""
-    node = SEGsToMask()
-
-    mask = np.ones((20, 20), dtype=np.float32)
+    mask = masks[20]
 
     segs = create_mock_segs(512, 512, [
         (mask, [100, 10, 120, 30], "seg_0", 0.95),   # x=100, y=10
@@ -314,11 +303,9 @@ def test_sort_order_y_then_x():
     print("✓ test_sort_order_y_then_x passed")
 
 
-def test_invert_mode():
+def test_invert_mode(node, masks):
     """Test inverted masks"""
-    node = SEGsToMask()
-
-    mask = np.ones((50, 50), dtype=np.float32)
+    mask = masks[50]
     segs = create_mock_segs(512, 512, [
         (mask, [10, 10, 60, 60], "person_0", 0.95)
     ])
@@ -326,33 +313,29 @@ def test_invert_mode():
     combined, individual, labels, count = node.segs_to_mask(segs, invert=True)
 
     # Mask region should be 0, rest should be 1
-    assert combined[10:60, 10:60].sum() == 0, "Mask region should be 0 when inverted"
-    assert combined[0:10, 0:10].sum() > 0, "Outside region should be 1 when inverted"
+    assert not combined[10:60, 10:60].any(), "Mask region should be 0 when inverted"
+    assert combined[0:10, 0:10].any(), "Outside region should be 1 when inverted"
 
     print("✓ test_invert_mode passed")
 
 
-def test_empty_segs():
+def test_empty_segs(node):
     """Test with empty SEGS list"""
-    node = SEGsToMask()
-
     segs = ((512, 512), [])
 
     combined, individual, labels, count = node.segs_to_mask(segs)
 
     assert count == 0, f"Count should be 0, got {count}"
     assert len(individual) == 1, "Should return one empty mask"
-    assert individual[0].sum() == 0, "Empty mask should be all zeros"
+    assert not individual[0].any(), "Empty mask should be all zeros"
 
     print("✓ test_empty_segs passed")
 
 
-def test_none_cropped_mask():
+def test_none_cropped_mask(node, masks):
     """Test handling of None cropped_mask"""
-    node = SEGsToMask()
-
     # Valid mask and None mask
-    mask = np.ones((30, 30), dtype=np.float32)
+    mask = masks[30]
     segs = create_mock_segs(512, 512, [
         (mask, [10, 10, 40, 40], "person_0", 0.95),
         (None, [100, 100, 130, 130], "person_1", 0.90)
@@ -367,12 +350,10 @@ def test_none_cropped_mask():
     print("✓ test_none_cropped_mask passed")
 
 
-def test_crop_region_clamping():
+def test_crop_region_clamping(node, masks):
     """Test that crop regions are clamped to image bounds"""
-    node = SEGsToMask()
-
     # Mask that extends beyond image bounds
-    mask = np.ones((100, 100), dtype=np.float32)
+    mask = masks[100]
     segs = create_mock_segs(512, 512, [
         (mask, [480, 480, 580, 580], "person_0", 0.95)  # Extends beyond 512x512
     ])
@@ -382,17 +363,15 @@ def test_crop_region_clamping():
     # Should clamp to image bounds
     assert count == 1, "Should successfully process clamped region"
     # Should fill from 480 to 512 (32x32 region)
-    assert combined[480:512, 480:512].sum() == 32 * 32, "Should fill clamped region"
+    assert (combined[480:512, 480:512] == 1).all(), "Should fill clamped region"
 
     print("✓ test_crop_region_clamping passed")
 
 
-def test_combined_mask_union():
+def test_combined_mask_union(node, masks):
     """Test that combined mask is proper union of all individual masks"""
-    node = SEGsToMask()
-
-    mask1 = np.ones((30, 30), dtype=np.float32)
-    mask2 = np.ones((20, 20), dtype=np.float32)
+    mask1 = masks[30]
+    mask2 = masks[20]
 
     segs = create_mock_segs(512, 512, [
         (mask1, [10, 10, 40, 40], "person_0", 0.95),
@@ -402,8 +381,8 @@ def test_combined_mask_union():
     combined, individual, labels, count = node.segs_to_mask(segs)
 
     # Combined should have both regions
-    assert combined[10:40, 10:40].sum() == 30 * 30, "Combined should have first region"
-    assert combined[100:120, 100:120].sum() == 20 * 20, "Combined should have second region"
+    assert (combined[10:40, 10:40] == 1).all(), "Combined should have first region"
+    assert (combined[100:120, 100:120] == 1).all(), "Combined should have second region"
 
     # Combined should equal union of individuals
     manual_union = torch.zeros((512, 512), dtype=torch.float32)
@@ -438,11 +417,9 @@ def test_input_types_structure():
     print("✓ test_input_types_structure passed")
 
 
-def test_return_types():
+def test_return_types(node, masks):
     """Validate return types match RETURN_TYPES"""
-    node = SEGsToMask()
-
-    mask = np.ones((30, 30), dtype=np.float32)
+    mask = masks[30]
     segs = create_mock_segs(512, 512, [
         (mask, [10, 10, 40, 40], "person_0", 0.95)
     ])
@@ -465,12 +442,10 @@ def test_return_types():
     print("✓ test_return_types passed")
 
 
-def test_numpy_array_confidence():
+def test_numpy_array_confidence(node, masks):
     """Test handling of numpy array confidence values (ImpactPack format)"""
-    node = SEGsToMask()
-
     # Create SEG with numpy array confidence (like ImpactPack)
-    mask = np.ones((50, 50), dtype=np.float32)
+    mask = masks[50]
     seg_data = [
         (mask, [10, 10, 60, 60], "person", np.array([0.9457324], dtype=np.float32)),
         (mask, [100, 100, 150, 150], "dog", np.array([0.8123456], dtype=np.float32))
@@ -491,48 +466,21 @@ def test_numpy_array_confidence():
 
 
 def run_all_tests():
-    """Run all test functions"""
+    """Run all test functions through pytest so fixtures are honored"""
     print("Running tests for SEGsToMask...\n")
 
-    try:
-        test_basic_single_seg()
-        test_union_same_labels()
-        test_no_union_separate_masks()
-        test_multiple_labels()
-        test_label_filter_wildcard()
-        test_confidence_filter()
-        test_min_area_filter()
-        test_sort_order_x_then_y()
-        test_sort_order_confidence()
-        test_sort_order_y_then_x()
-        test_invert_mode()
-        test_empty_segs()
-        test_none_cropped_mask()
-        test_crop_region_clamping()
-        test_combined_mask_union()
-        test_input_types_structure()
-        test_return_types()
-        test_numpy_array_confidence()
-
-        print("\n" + "="*50)
+    exit_code = pytest.main([__file__, "-q", "-p", "no:cacheprovider"])
+
+    print("\n" + "="*50)
+    if exit_code == 0:
         print("✅ ALL TESTS PASSED!")
-        print("="*50)
-        return True
-
-    except AssertionError as e:
-        print("\n" + "="*50)
-        print(f"❌ TEST FAILED: {e}")
-        print("="*50)
-        return False
-    except Exception as e:
-        print("\n" + "="*50)
-        print(f"❌ UNEXPECTED ERROR: {e}")
-        print("="*50)
-        import traceback
-        traceback.print_exc()
-        return False
+    else:
+        print(f"❌ TESTS FAILED (pytest exit code {int(exit_code)})")
+    print("="*50)
+
+    return exit_code == 0
 
 
 if __name__ == "__main__":
     success = run_all_tests()
-    exit(0 if success else 1)
+    sys.exit(0 if success else 1)
@@ -5,16 +5,18 @@ Test the conversion of SEGS format to SAM3 Selector query formats.
 """
 
 import sys
-from pathlib import Path
 import json
 import torch
 import numpy as np
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from segs_to_sam3_query import SEGsToSAM3Query
 
+# Expected output keys (dict key views compare directly against sets)
+TBG_BOX_KEYS = frozenset({"x1", "y1", "x2", "y2"})
+TBG_POINT_KEYS = frozenset({"x", "y"})
+SAM3_BOX_KEYS = frozenset({"boxes", "labels"})
+SAM3_POINT_KEYS = frozenset({"points", "labels"})
+
 
 class MockSEG:
     """Mock SEG object for testing"""
@@ -198,6 +200,22 @@ def test_empty_segs():
     print("✓ test_empty_segs passed")
 
 
+def test_empty_results_not_shared():
+    """Test that modifying one empty result does not affect later calls"""
+    node = SEGsToSAM3Query()
+
+    box_sam3, point_sam3, _, _ = node.segs_to_sam3_query(((256, 256), []))
+    box_sam3["boxes"].append([0.1, 0.1, 0.2, 0.2])
+    point_sam3["points"].append([0.5, 0.5])
+
+    for segs in [((256, 256), []), "invalid", ("invalid", [])]:
+        box_sam3, point_sam3, _, _ = node.segs_to_sam3_query(segs)
+        assert box_sam3 == {"boxes": [], "labels": []}, f"Empty box prompt was modified: {box_sam3}"
+        assert point_sam3 == {"points": [], "labels": []}, f"Empty point prompt was modified: {point_sam3}"
+
+    print("✓ test_empty_results_not_shared passed")
+
+
 def test_invalid_segs_format():
     """Test handling of invalid SEGS format"""
     node = SEGsToSAM3Query()
@@ -340,11 +358,11 @@ def test_json_format_validation():
     # Check structure
     assert isinstance(box_tbg, list), "Box query should be a list"
     assert isinstance(box_tbg[0], dict), "Box query item should be a dict"
-    assert set(box_tbg[0].keys()) == {"x1", "y1", "x2", "y2"}, "Box query should have x1, y1, x2, y2 keys"
+    assert box_tbg[0].keys() == TBG_BOX_KEYS, "Box query should have x1, y1, x2, y2 keys"
 
     assert isinstance(point_tbg, list), "Point query should be a list"
     assert isinstance(point_tbg[0], dict), "Point query item should be a dict"
-    assert set(point_tbg[0].keys()) == {"x", "y"}, "Point query should have x, y keys"
+    assert point_tbg[0].keys() == TBG_POINT_KEYS, "Point query should have x, y keys"
 
     # All values should be floats
     assert all(isinstance(v, float) for v in box_tbg[0].values()), "Box query values should be floats"
@@ -423,14 +441,14 @@ def test_sam3_format_structure():
 
     # Box prompt structure
     assert isinstance(box_sam3, dict), "Box prompt should be a dict"
-    assert set(box_sam3.keys()) == {"boxes", "labels"}, "Box prompt should have 'boxes' and 'labels' keys"
+    assert box_sam3.keys() == SAM3_BOX_KEYS, "Box prompt should have 'boxes' and 'labels' keys"
     assert isinstance(box_sam3["boxes"], list), "boxes should be a list"
     assert isinstance(box_sam3["labels"], list), "labels should be a list"
     assert len(box_sam3["boxes"][0]) == 4, "Box should have 4 coordinates (XYWH)"
 
     # Point prompt structure
     assert isinstance(point_sam3, dict), "Point prompt should be a dict"
-    assert set(point_sam3.keys()) == {"points", "labels"}, "Point prompt should have 'points' and 'labels' keys"
+    assert point_sam3.keys() == SAM3_POINT_KEYS, "Point prompt should have 'points' and 'labels' keys"
     assert isinstance(point_sam3["points"], list), "points should be a list"
     assert isinstance(point_sam3["labels"], list), "labels should be a list"
     assert len(point_sam3["points"][0]) == 2, "Point should have 2 coordinates (XY)"
@@ -475,6 +493,7 @@ def run_all_tests():
         test_multiple_segments_union,
         test_centroid_calculation,
         test_empty_segs,
+        test_empty_results_not_shared,
         test_invalid_segs_format,
         test_none_cropped_mask,
         test_coordinate_clamping,
@@ -1,16 +1,10 @@
 """
 Tests for String Index Selector Node
 
-Run with: python test_string_index_selector.py
+Run from project root:
+    python -m tests.test_string_index_selector
 """
 
-import inspect
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from string_index_selector import StringIndexSelector
 
 
@@ -172,9 +166,7 @@ def test_input_types_structure():
         all_inputs.update(input_types["optional"].keys())
     
     # Get function parameters
-    function = getattr(StringIndexSelector(), StringIndexSelector.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = StringIndexSelector._FUNCTION_PARAMS
     
     # Check they match
     missing = function_params - all_inputs
@@ -1,17 +1,10 @@
 """
 Tests for String Joiner Node
 
-Run with: python test_string_joiner.py
+Run from project root:
+    python -m tests.test_string_joiner
 """
 
-import inspect
-
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import node modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from string_joiner import StringJoiner
 
 
@@ -153,9 +146,7 @@ def test_input_types_structure():
     if "optional" in input_types:
         all_inputs.update(input_types["optional"].keys())
     
-    function = getattr(StringJoiner(), StringJoiner.FUNCTION)
-    sig = inspect.signature(function)
-    function_params = set(sig.parameters.keys()) - {'self'}
+    function_params = StringJoiner._FUNCTION_PARAMS
     
     missing = function_params - all_inputs
     extra = all_inputs - function_params